@@ -1,10 +1,13 @@
 import os
+import sys
 
 def list_files_in_folder(folder_path):
     try:
-        files = os.listdir(folder_path)
-        for file in files:
-            print(file)
+        # scandir streams entries; print them all with one buffered write
+        with os.scandir(folder_path) as entries:
+            names = [entry.name for entry in entries]
+        if names:
+            sys.stdout.write('\n'.join(names) + '\n')
     except Exception as e:
         print(f"An error occurred: {e}")
 
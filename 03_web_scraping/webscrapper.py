@@ -7,8 +7,8 @@ url = "https://en.wikipedia.org/wiki/Geoffrey_Hinton"
 # Send a GET request to the URL
 response = requests.get(url)
 
-# Parse the HTML content of the page
-soup = BeautifulSoup(response.content, 'html.parser')
+# Parse the HTML content of the page (lxml's C parser is much faster than html.parser)
+soup = BeautifulSoup(response.content, 'lxml')
 
 # Extract the title of the page
 title = soup.find('h1', {'id': 'firstHeading'}).text
@@ -23,6 +23,6 @@ headings = soup.find_all(['h2', 'h3'])
 for heading in headings:
     print(f"Heading: {heading.text.strip()}")
 
-# Save the entire page content to a file
-with open('geoffrey_hinton_wikipedia.html', 'w', encoding='utf-8') as file:
-    file.write(soup.prettify())
\ No newline at end of file
+# Save the entire page content to a file (raw bytes, no re-serialization)
+with open('geoffrey_hinton_wikipedia.html', 'wb') as file:
+    file.write(response.content)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import pyautogui
-import math
+import numpy as np
 import time
 
 # Set the radius of the circle
@@ -16,9 +16,12 @@ steps = 100
 # Delay between each step
 delay = 0.01
 
-for i in range(steps):
-    angle = 2 * math.pi * i / steps
-    x = center_x + radius * math.cos(angle)
-    y = center_y + radius * math.sin(angle)
-    pyautogui.moveTo(x, y)
+# Precompute every point on the circle in one vectorized pass
+angles = np.linspace(0, 2 * np.pi, steps, endpoint=False)
+xs = center_x + radius * np.cos(angles)
+ys = center_y + radius * np.sin(angles)
+
+# _pause=False skips pyautogui's default 0.1s pause so only our delay applies
+for x, y in zip(xs.tolist(), ys.tolist()):
+    pyautogui.moveTo(x, y, _pause=False)
     time.sleep(delay)
\ No newline at end of file
@@ -6,37 +6,260 @@ This script demonstrates various chart creation techniques using matplotlib
 and seaborn for creating professional-looking data visualizations.
 
 Author: Python Learning Series
-Dependencies: matplotlib, seaborn, pandas, numpy
+Dependencies: matplotlib, seaborn, pandas, numpy, numba (optional), pyarrow (optional)
 """
 
+import os
+import matplotlib
+
+# Use the non-interactive Agg backend only when explicitly asked for a headless
+# run; notebooks and IDE consoles also have non-TTY stdout but need their backend
+HEADLESS = bool(os.environ.get('CHART_HEADLESS'))
+if HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 import warnings
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
 
+def _column_stats(values: np.ndarray) -> Dict[str, float]:
+    """
+    Compute count, mean, median, std, min and max of a NaN-free array.
+    
+    The variance comes from centred values, so columns with a large offset
+    keep their spread instead of losing it to cancellation.
+    
+    Args:
+        values: 1-D float array without NaNs
+        
+    Returns:
+        Dict with the summary statistics (std uses ddof=1 like pandas)
+    """
+    n = values.size
+    if n == 0:
+        return {'count': 0, 'mean': np.nan, 'median': np.nan,
+                'std': np.nan, 'min': np.nan, 'max': np.nan}
+    
+    mean = values.sum() / n
+    centred = values - mean
+    variance = np.dot(centred, centred) / (n - 1) if n > 1 else np.nan
+    
+    # Median via partial sort instead of a full sort
+    half = n // 2
+    part = np.partition(values, [half - 1, half] if n > 1 else [half])
+    median = part[half] if n % 2 else (part[half - 1] + part[half]) / 2
+    
+    return {
+        'count': n,
+        'mean': mean,
+        'median': median,
+        'std': np.sqrt(variance) if n > 1 else np.nan,
+        'min': values.min(),
+        'max': values.max()
+    }
+
+
+def _pixel_dedup(x: np.ndarray, y: np.ndarray, width_px: int,
+                 height_px: int) -> np.ndarray:
+    """
+    Select one point per (x-pixel, y-pixel) cell of the plot area.
+    
+    Points that would land on an already occupied pixel are dropped, so the
+    number of drawn points is bounded by the pixel count while every pixel
+    that holds data, interior of dense clouds included, stays covered.
+    
+    Args:
+        x: X values
+        y: Y values
+        width_px: Number of pixel columns
+        height_px: Number of pixel rows
+        
+    Returns:
+        np.ndarray: Sorted positional indices of the points to keep
+    """
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if valid.size == 0:
+        return valid
+    
+    cells = np.zeros(valid.size, dtype=np.int64)
+    for values, n_px in ((x[valid], width_px), (y[valid], height_px)):
+        v_min, v_span = values.min(), values.max() - values.min()
+        if v_span > 0:
+            pixel = np.minimum(((values - v_min) / v_span * n_px).astype(np.int64), n_px - 1)
+        else:
+            pixel = np.zeros(values.size, dtype=np.int64)
+        cells = cells * n_px + pixel
+    
+    # First point in each occupied cell
+    _, first = np.unique(cells, return_index=True)
+    return valid[np.sort(first)]
+
+
+def _linfit_corr_loop(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Fit y = slope * x + intercept and compute Pearson r in two passes.
+    
+    The first pass takes the means and the second accumulates centred
+    sums, so data with a large offset (e.g. Unix timestamps) does not lose
+    its variance to cancellation as raw sums of squares would.
+    
+    Args:
+        x: X values without NaNs
+        y: Y values without NaNs
+        
+    Returns:
+        Tuple of (slope, intercept, correlation); slope and intercept are NaN
+        when x is constant (or n < 2), correlation also when y is constant
+    """
+    n = x.size
+    if n < 2:
+        return np.nan, np.nan, np.nan
+    sx = sy = 0.0
+    for i in range(n):
+        sx += x[i]
+        sy += y[i]
+    mean_x = sx / n
+    mean_y = sy / n
+    
+    sxx = syy = sxy = 0.0
+    for i in range(n):
+        dx = x[i] - mean_x
+        dy = y[i] - mean_y
+        sxx += dx * dx
+        syy += dy * dy
+        sxy += dx * dy
+    return _fit_from_moments(n, mean_x, mean_y, sxx, syy, sxy)
+
+
+def _fit_from_moments(n, mean_x, mean_y, sxx, syy, sxy):
+    """
+    Turn means and centred sums of squares/products into (slope, intercept, r).
+    
+    A centred sum at rounding-error level relative to the column's magnitude
+    counts as zero, so constant columns give NaN instead of dividing by zero
+    (a ZeroDivisionError under Numba) or by rounding noise.
+    """
+    if sxx <= 1e-20 * (sxx + n * mean_x * mean_x):
+        return np.nan, np.nan, np.nan
+    slope = sxy / sxx
+    if syy <= 1e-20 * (syy + n * mean_y * mean_y):
+        return slope, mean_y - slope * mean_x, np.nan
+    return slope, mean_y - slope * mean_x, sxy / np.sqrt(sxx * syy)
+
+
+def _linfit_corr_numpy(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
+    """Same as _linfit_corr_loop using NumPy dot products (no Numba)."""
+    n = x.size
+    if n < 2:
+        return np.nan, np.nan, np.nan
+    mean_x = x.sum() / n
+    mean_y = y.sum() / n
+    dx = x - mean_x
+    dy = y - mean_y
+    return _fit_from_moments(n, mean_x, mean_y, np.dot(dx, dx), np.dot(dy, dy),
+                             np.dot(dx, dy))
+
+
+# JIT-compile the fused loop when Numba is installed
+if njit is not None:
+    _fit_from_moments = njit(cache=True)(_fit_from_moments)
+    _linfit_corr = njit(cache=True, fastmath=True)(_linfit_corr_loop)
+else:
+    _linfit_corr = _linfit_corr_numpy
+
+
+def _coerce_categoricals(df: pd.DataFrame, max_card: int = 50) -> pd.DataFrame:
+    """
+    Convert low-cardinality object columns to the category dtype.
+    
+    Meant to be applied once when data is loaded, so value_counts, unique
+    and groupby in the create_* methods work on integer codes.
+    
+    Args:
+        df: DataFrame to convert
+        max_card: Maximum number of distinct values for a category column
+        
+    Returns:
+        pd.DataFrame: DataFrame with converted columns (same object if none)
+    """
+    converted = {}
+    for col in df.select_dtypes(include=['object']).columns:
+        n_unique = df[col].nunique()
+        if n_unique <= max_card and n_unique < 0.5 * len(df):
+            converted[col] = df[col].astype('category')
+    
+    return df.assign(**converted) if converted else df
+
+
+def _correlation_matrix(numeric_data: pd.DataFrame,
+                        values: np.ndarray = None) -> pd.DataFrame:
+    """
+    Compute a Pearson correlation matrix, using np.corrcoef when possible.
+    
+    DataFrame.corr masks NaNs pair by pair; when the data has no NaNs a
+    single np.corrcoef call gives the same result much faster.
+    
+    Args:
+        numeric_data: DataFrame with numeric columns only
+        values: Optional float array of numeric_data if already computed
+        
+    Returns:
+        pd.DataFrame: Correlation matrix labelled by column
+    """
+    if values is None:
+        values = numeric_data.to_numpy(dtype=float, na_value=np.nan)
+    
+    if np.isnan(values).any():
+        return numeric_data.corr()
+    
+    corr = np.atleast_2d(np.corrcoef(values, rowvar=False))
+    return pd.DataFrame(corr, index=numeric_data.columns, columns=numeric_data.columns)
+
+
 class ChartCreator:
     """
     A comprehensive chart creation class that provides methods for creating
     various types of visualizations using matplotlib and seaborn.
     """
     
-    def __init__(self, style: str = 'seaborn-v0_8', figsize: Tuple[int, int] = (10, 6)):
+    def __init__(self, style: str = 'seaborn-v0_8', figsize: Tuple[int, int] = (10, 6),
+                 reuse_figures: bool = False):
         """
         Initialize the ChartCreator.
         
         Args:
             style: Matplotlib style to use
             figsize: Default figure size (width, height)
+            reuse_figures: Draw saved charts on one recycled figure per size
+                (batch rendering); a figure returned for a saved chart is
+                then cleared by the next saved chart of the same size
         """
         self.style = style
         self.figsize = figsize
+        self.reuse_figures = reuse_figures
+        self._figure_pool: Dict[Tuple[Tuple[float, float], bool], plt.Figure] = {}
         self.setup_style()
     
     def setup_style(self):
@@ -63,6 +286,55 @@ class ChartCreator:
             'figure.dpi': 100
         })
     
+    def _get_figure(self, figsize: Tuple[float, float] = None,
+                    constrained: bool = True, save_path: str = None) -> plt.Figure:
+        """
+        Get an empty figure for a new chart.
+        
+        With reuse_figures enabled, charts that are saved reuse a cleared
+        figure kept per size, skipping figure allocation; the figure returned
+        by such a call is only valid until the next saved chart of the same
+        size. Otherwise every chart gets a fresh figure, so figures held by
+        the caller or waiting for plt.show() stay intact.
+        
+        Args:
+            figsize: Figure size (width, height), defaults to self.figsize
+            constrained: Whether the figure uses constrained layout
+            save_path: Where the chart will be saved, if anywhere
+            
+        Returns:
+            plt.Figure: An empty figure ready for new axes
+        """
+        key = (tuple(figsize or self.figsize), constrained)
+        if not (self.reuse_figures and save_path):
+            return plt.figure(figsize=key[0], constrained_layout=constrained)
+        
+        fig = self._figure_pool.get(key)
+        if fig is None:
+            fig = plt.figure(figsize=key[0], constrained_layout=constrained)
+            self._figure_pool[key] = fig
+        else:
+            fig.clear()
+        
+        return fig
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _cmap_colors(name: str, n: int) -> np.ndarray:
+        """
+        Get n evenly spaced colors from a colormap, cached per (name, n).
+        
+        Args:
+            name: Colormap name
+            n: Number of colors
+            
+        Returns:
+            np.ndarray: Read-only (n, 4) RGBA array
+        """
+        colors = plt.get_cmap(name)(np.linspace(0, 1, n))
+        colors.flags.writeable = False
+        return colors
+    
     def create_line_chart(self, data: pd.DataFrame, x_col: str, y_col: str,
                          title: str = None, save_path: str = None,
                          group_col: str = None) -> plt.Figure:
@@ -81,15 +353,34 @@ class ChartCreator:
             plt.Figure: The created figure
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figsize)
+            fig = self._get_figure(save_path=save_path)
+            ax = fig.add_subplot(111)
             
             if group_col and group_col in data.columns:
-                # Create multiple lines for each group
-                for group in data[group_col].unique():
-                    group_data = data[data[group_col] == group]
-                    ax.plot(group_data[x_col], group_data[y_col], 
-                           marker='o', label=str(group), linewidth=2)
-                ax.legend()
+                # Sort rows by group once, then draw every group as one LineCollection
+                codes, groups = pd.factorize(data[group_col])
+                order = np.argsort(codes, kind='stable')
+                order = order[codes[order] >= 0]
+                sorted_codes = codes[order]
+                
+                ax.xaxis.update_units(data[x_col].to_numpy())
+                x_values = np.asarray(ax.convert_xunits(data[x_col].to_numpy()[order]), dtype=float)
+                y_values = data[y_col].to_numpy(dtype=float)[order]
+                splits = np.flatnonzero(np.diff(sorted_codes)) + 1
+                segments = [np.column_stack(pair) for pair in
+                            zip(np.split(x_values, splits), np.split(y_values, splits))]
+                
+                cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+                colors = matplotlib.colors.to_rgba_array(
+                    [cycle[i % len(cycle)] for i in range(len(groups))])
+                
+                ax.add_collection(LineCollection(segments, colors=colors, linewidths=2))
+                ax.scatter(x_values, y_values, s=36, c=colors[sorted_codes], zorder=3)
+                ax.autoscale_view()
+                
+                handles = [Line2D([], [], color=color, marker='o', linewidth=2, label=str(group))
+                           for group, color in zip(groups, colors)]
+                ax.legend(handles=handles)
             else:
                 # Single line
                 ax.plot(data[x_col], data[y_col], marker='o', 
@@ -105,7 +396,6 @@ class ChartCreator:
                            fontsize=16, fontweight='bold')
             
             ax.grid(True, alpha=0.3)
-            plt.tight_layout()
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -135,13 +425,14 @@ class ChartCreator:
             plt.Figure: The created figure
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figsize)
+            fig = self._get_figure(save_path=save_path)
+            ax = fig.add_subplot(111)
             
             # Prepare data
             if color_col and color_col in data.columns:
-                colors = plt.cm.viridis(np.linspace(0, 1, len(data)))
+                colors = self._cmap_colors('viridis', len(data))
             else:
-                colors = plt.cm.tab10(np.linspace(0, 1, len(data)))
+                colors = self._cmap_colors('tab10', len(data))
             
             if horizontal:
                 bars = ax.barh(data[x_col], data[y_col], color=colors)
@@ -152,20 +443,13 @@ class ChartCreator:
                 ax.set_xlabel(x_col.replace('_', ' ').title())
                 ax.set_ylabel(y_col.replace('_', ' ').title())
                 
-                # Rotate x-axis labels if they're long
-                if data[x_col].astype(str).str.len().max() > 8:
-                    plt.xticks(rotation=45, ha='right')
+                # Rotate x-axis labels if they're long (only unique labels are checked)
+                longest = max((len(str(value)) for value in data[x_col].unique()), default=0)
+                if longest > 8:
+                    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
             
             # Add value labels on bars
-            for bar in bars:
-                if horizontal:
-                    width = bar.get_width()
-                    ax.text(width, bar.get_y() + bar.get_height()/2,
-                           f'{width:.1f}', ha='left', va='center')
-                else:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2, height,
-                           f'{height:.1f}', ha='center', va='bottom')
+            ax.bar_label(bars, fmt='%.1f', label_type='edge', padding=2)
             
             if title:
                 ax.set_title(title, fontsize=16, fontweight='bold')
@@ -175,7 +459,6 @@ class ChartCreator:
                            fontsize=16, fontweight='bold')
             
             ax.grid(True, alpha=0.3, axis='y' if not horizontal else 'x')
-            plt.tight_layout()
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -205,27 +488,39 @@ class ChartCreator:
             plt.Figure: The created figure
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figsize)
+            fig = self._get_figure(save_path=save_path)
+            ax = fig.add_subplot(111)
+            
+            x_values = data[x_col].to_numpy(dtype=float)
+            y_values = data[y_col].to_numpy(dtype=float)
+            
+            # Large datasets: draw at most one point per pixel of the figure
+            width_px = int(fig.get_figwidth() * fig.dpi)
+            height_px = int(fig.get_figheight() * fig.dpi)
+            if len(data) > 4 * width_px:
+                keep = _pixel_dedup(x_values, y_values, width_px, height_px)
+                plot_data = data.iloc[keep]
+            else:
+                plot_data = data
             
             # Prepare size and color arrays
-            sizes = data[size_col] * 10 if size_col and size_col in data.columns else 50
-            colors = data[color_col] if color_col and color_col in data.columns else 'blue'
+            sizes = plot_data[size_col] * 10 if size_col and size_col in data.columns else 50
+            colors = plot_data[color_col] if color_col and color_col in data.columns else 'blue'
             
-            scatter = ax.scatter(data[x_col], data[y_col], s=sizes, c=colors,
+            scatter = ax.scatter(plot_data[x_col], plot_data[y_col], s=sizes, c=colors,
                                alpha=0.6, cmap='viridis')
             
             # Add colorbar if color column is used
             if color_col and color_col in data.columns:
-                cbar = plt.colorbar(scatter)
+                cbar = fig.colorbar(scatter, ax=ax)
                 cbar.set_label(color_col.replace('_', ' ').title())
             
-            # Add trendline
-            z = np.polyfit(data[x_col], data[y_col], 1)
-            p = np.poly1d(z)
-            ax.plot(data[x_col], p(data[x_col]), "r--", alpha=0.8, linewidth=1)
+            # Trendline and correlation coefficient from one fused pass
+            valid = np.isfinite(x_values) & np.isfinite(y_values)
+            slope, intercept, corr_coef = _linfit_corr(x_values[valid], y_values[valid])
+            if np.isfinite(slope):
+                ax.plot(x_values, slope * x_values + intercept, "r--", alpha=0.8, linewidth=1)
             
-            # Calculate correlation coefficient
-            corr_coef = data[x_col].corr(data[y_col])
             ax.text(0.05, 0.95, f'r = {corr_coef:.3f}', transform=ax.transAxes,
                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
             
@@ -239,7 +534,6 @@ class ChartCreator:
                            fontsize=16, fontweight='bold')
             
             ax.grid(True, alpha=0.3)
-            plt.tight_layout()
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -268,15 +562,20 @@ class ChartCreator:
             plt.Figure: The created figure
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figsize)
+            fig = self._get_figure(save_path=save_path)
+            ax = fig.add_subplot(111)
             
-            # Create histogram
-            n, bins, patches = ax.hist(data[col].dropna(), bins=bins, 
-                                     alpha=0.7, color='skyblue', edgecolor='black')
+            # Bin with NumPy and draw all bins as a single bar call
+            values = data[col].to_numpy(dtype=float)
+            values = values[~np.isnan(values)]
+            counts, edges = np.histogram(values, bins=bins)
+            ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                  alpha=0.7, color='skyblue', edgecolor='black')
             
             # Add statistical lines
-            mean_val = data[col].mean()
-            median_val = data[col].median()
+            stats = _column_stats(values)
+            mean_val = stats['mean']
+            median_val = stats['median']
             
             ax.axvline(mean_val, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_val:.2f}')
             ax.axvline(median_val, color='orange', linestyle='--', linewidth=2, label=f'Median: {median_val:.2f}')
@@ -284,12 +583,12 @@ class ChartCreator:
             if show_stats:
                 # Add statistics text box
                 stats_text = f"""
-                Count: {data[col].count()}
+                Count: {stats['count']}
                 Mean: {mean_val:.2f}
                 Median: {median_val:.2f}
-                Std: {data[col].std():.2f}
-                Min: {data[col].min():.2f}
-                Max: {data[col].max():.2f}
+                Std: {stats['std']:.2f}
+                Min: {stats['min']:.2f}
+                Max: {stats['max']:.2f}
                 """.strip()
                 
                 ax.text(0.75, 0.95, stats_text, transform=ax.transAxes, 
@@ -307,7 +606,6 @@ class ChartCreator:
             
             ax.legend()
             ax.grid(True, alpha=0.3)
-            plt.tight_layout()
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -334,17 +632,29 @@ class ChartCreator:
             plt.Figure: The created figure
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figsize)
-            
-            # Get value counts
-            value_counts = data[col].value_counts()
+            fig = self._get_figure(save_path=save_path)
+            ax = fig.add_subplot(111)
+            
+            # Get unsorted value counts (bincount on codes for category columns)
+            series = data[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                counts = np.bincount(codes[codes >= 0],
+                                     minlength=len(series.cat.categories))
+                value_counts = pd.Series(counts,
+                                         index=series.cat.categories.astype(object))
+                value_counts = value_counts[value_counts > 0]
+            else:
+                value_counts = series.value_counts(sort=False)
             
-            # Handle too many categories
+            # Handle too many categories (partial selection instead of a full sort)
             if len(value_counts) > max_categories:
-                top_categories = value_counts.head(max_categories - 1)
-                others_count = value_counts.iloc[max_categories - 1:].sum()
-                top_categories['Others'] = others_count
-                value_counts = top_categories
+                top_categories = value_counts.nlargest(max_categories - 1)
+                others_count = value_counts.sum() - top_categories.sum()
+                value_counts = pd.concat([top_categories,
+                                          pd.Series({'Others': others_count})])
+            else:
+                value_counts = value_counts.sort_values(ascending=False)
             
             # Create pie chart
             wedges, texts, autotexts = ax.pie(value_counts.values, 
@@ -367,7 +677,6 @@ class ChartCreator:
             
             # Equal aspect ratio ensures that pie is drawn as a circle
             ax.axis('equal')
-            plt.tight_layout()
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -394,18 +703,19 @@ class ChartCreator:
             plt.Figure: The created figure
         """
         try:
-            fig, ax = plt.subplots(figsize=self.figsize)
+            fig = self._get_figure(save_path=save_path)
+            ax = fig.add_subplot(111)
             
             if x_col and x_col in data.columns:
                 # Grouped box plot
+                labels = list(data[x_col].unique())
                 box_data = [data[data[x_col] == group][y_col].dropna() 
-                           for group in data[x_col].unique()]
-                labels = data[x_col].unique()
+                           for group in labels]
                 
                 bp = ax.boxplot(box_data, labels=labels, patch_artist=True)
                 
                 # Color the boxes
-                colors = plt.cm.Set2(np.linspace(0, 1, len(bp['boxes'])))
+                colors = self._cmap_colors('Set2', len(bp['boxes']))
                 for patch, color in zip(bp['boxes'], colors):
                     patch.set_facecolor(color)
                 
@@ -414,7 +724,7 @@ class ChartCreator:
                 
                 # Rotate labels if necessary
                 if max(len(str(label)) for label in labels) > 8:
-                    plt.xticks(rotation=45, ha='right')
+                    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
                 
             else:
                 # Single box plot
@@ -429,7 +739,6 @@ class ChartCreator:
                            fontsize=16, fontweight='bold')
             
             ax.grid(True, alpha=0.3)
-            plt.tight_layout()
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -463,10 +772,12 @@ class ChartCreator:
                 return None
             
             # Calculate correlation matrix
-            corr_matrix = numeric_data.corr()
+            corr_matrix = _correlation_matrix(numeric_data)
             
-            fig, ax = plt.subplots(figsize=(max(8, len(corr_matrix.columns)), 
-                                           max(6, len(corr_matrix.columns))))
+            fig = self._get_figure((max(8, len(corr_matrix.columns)),
+                                    max(6, len(corr_matrix.columns))),
+                                   save_path=save_path)
+            ax = fig.add_subplot(111)
             
             # Create heatmap
             sns.heatmap(corr_matrix, annot=annot, cmap='coolwarm', center=0,
@@ -477,7 +788,6 @@ class ChartCreator:
             else:
                 ax.set_title('Correlation Heatmap', fontsize=16, fontweight='bold')
             
-            plt.tight_layout()
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -489,72 +799,100 @@ class ChartCreator:
             return None
     
     def create_multi_chart_dashboard(self, data: pd.DataFrame, 
-                                   save_path: str = None) -> plt.Figure:
+                                   save_path: str = None,
+                                   category_counts: pd.Series = None) -> plt.Figure:
         """
         Create a dashboard with multiple charts.
         
         Args:
             data: DataFrame containing the data
             save_path: Path to save the dashboard
+            category_counts: Precomputed counts of the first categorical column
             
         Returns:
             plt.Figure: The created figure
         """
         try:
-            # Create subplots
-            fig = plt.figure(figsize=(16, 12))
+            # Create subplots on a fixed grid instead of a layout engine
+            fig = self._get_figure((16, 12), constrained=False, save_path=save_path)
+            grid = fig.add_gridspec(2, 3, left=0.06, right=0.97, top=0.92, bottom=0.08,
+                                    hspace=0.4, wspace=0.3)
             
             # Get numeric and categorical columns
-            numeric_cols = data.select_dtypes(include=[np.number]).columns.tolist()
-            categorical_cols = data.select_dtypes(include=['object']).columns.tolist()
+            numeric_data = data.select_dtypes(include=[np.number])
+            numeric_cols = numeric_data.columns.tolist()
+            categorical_cols = data.select_dtypes(include=['object', 'category']).columns.tolist()
             
             if len(numeric_cols) < 2:
                 print("Need at least 2 numeric columns for dashboard")
                 return None
             
+            # Shared numeric matrix and NaN mask, reused by every chart below
+            num_np = numeric_data.to_numpy(dtype=float, na_value=np.nan)
+            nan_mask = np.isnan(num_np)
+            first_col = num_np[:, 0]
+            
             # Chart 1: Histogram of first numeric column
-            ax1 = plt.subplot(2, 3, 1)
-            data[numeric_cols[0]].hist(bins=20, ax=ax1, alpha=0.7, color='skyblue')
+            ax1 = fig.add_subplot(grid[0, 0])
+            ax1.hist(first_col[~nan_mask[:, 0]], bins=20, alpha=0.7, color='skyblue')
             ax1.set_title(f'Distribution of {numeric_cols[0]}')
             ax1.grid(True, alpha=0.3)
             
             # Chart 2: Scatter plot of two numeric columns
-            ax2 = plt.subplot(2, 3, 2)
-            ax2.scatter(data[numeric_cols[0]], data[numeric_cols[1]], alpha=0.6)
+            ax2 = fig.add_subplot(grid[0, 1])
+            ax2.scatter(first_col, num_np[:, 1], alpha=0.6)
             ax2.set_xlabel(numeric_cols[0])
             ax2.set_ylabel(numeric_cols[1])
             ax2.set_title(f'{numeric_cols[1]} vs {numeric_cols[0]}')
             ax2.grid(True, alpha=0.3)
             
             # Chart 3: Box plot
-            ax3 = plt.subplot(2, 3, 3)
-            data.boxplot(column=numeric_cols[0], ax=ax3)
+            ax3 = fig.add_subplot(grid[0, 2])
+            box_values = first_col[~nan_mask[:, 0]]
+            q1, median, q3 = np.quantile(box_values, [0.25, 0.5, 0.75])
+            iqr = q3 - q1
+            inside = box_values[(box_values >= q1 - 1.5 * iqr) & (box_values <= q3 + 1.5 * iqr)]
+            ax3.bxp([{
+                'med': median, 'q1': q1, 'q3': q3,
+                'whislo': inside.min(), 'whishi': inside.max(),
+                'fliers': box_values[(box_values < inside.min()) | (box_values > inside.max())],
+                'label': numeric_cols[0]
+            }], showfliers=True)
+            ax3.grid(True, alpha=0.3)
             ax3.set_title(f'Box Plot: {numeric_cols[0]}')
             
             # Chart 4: Bar chart (if categorical column exists)
-            ax4 = plt.subplot(2, 3, 4)
+            ax4 = fig.add_subplot(grid[1, 0])
             if categorical_cols:
-                value_counts = data[categorical_cols[0]].value_counts()
+                if category_counts is not None:
+                    value_counts = category_counts.sort_values(ascending=False)
+                else:
+                    value_counts = data[categorical_cols[0]].value_counts()
                 ax4.bar(value_counts.index, value_counts.values)
                 ax4.set_title(f'Count by {categorical_cols[0]}')
-                plt.xticks(rotation=45, ha='right')
+                plt.setp(ax4.get_xticklabels(), rotation=45, ha='right')
             else:
-                ax4.plot(data.index, data[numeric_cols[0]])
+                ax4.plot(data.index, first_col)
                 ax4.set_title(f'Line Plot: {numeric_cols[0]}')
             
             # Chart 5: Correlation heatmap
-            ax5 = plt.subplot(2, 3, 5)
-            corr_matrix = data[numeric_cols].corr()
+            ax5 = fig.add_subplot(grid[1, 1])
+            corr_matrix = _correlation_matrix(numeric_data, num_np)
             im = ax5.imshow(corr_matrix, cmap='coolwarm', aspect='auto')
             ax5.set_xticks(range(len(numeric_cols)))
             ax5.set_yticks(range(len(numeric_cols)))
             ax5.set_xticklabels(numeric_cols, rotation=45, ha='right')
             ax5.set_yticklabels(numeric_cols)
             ax5.set_title('Correlation Matrix')
-            plt.colorbar(im, ax=ax5, shrink=0.8)
-            
-            # Chart 6: Summary statistics
-            ax6 = plt.subplot(2, 3, 6)
+            fig.colorbar(im, ax=ax5, shrink=0.8)
+            
+            # Chart 6: Summary statistics (numeric NaN counts come from the shared mask)
+            other_cols = [col for col in data.columns if col not in numeric_data.columns]
+            missing = pd.concat([
+                pd.Series(nan_mask.sum(axis=0), index=numeric_cols),
+                data[other_cols].isnull().sum()
+            ]).reindex(data.columns)
+            ax6 = fig.add_subplot(grid[1, 2])
             ax6.axis('off')
             stats_text = f"""
             Dataset Summary:
@@ -565,13 +903,12 @@ class ChartCreator:
             Categorical Columns: {len(categorical_cols)}
             
             Missing Values:
-            {data.isnull().sum().to_string()}
+            {missing.to_string()}
             """
             ax6.text(0.1, 0.9, stats_text, transform=ax6.transAxes,
                     fontfamily='monospace', fontsize=10, verticalalignment='top')
             
-            plt.suptitle('Data Analysis Dashboard', fontsize=18, fontweight='bold')
-            plt.tight_layout()
+            fig.suptitle('Data Analysis Dashboard', fontsize=18, fontweight='bold')
             
             if save_path:
                 self._save_chart(fig, save_path)
@@ -595,15 +932,42 @@ class ChartCreator:
             # Create directory if it doesn't exist
             Path(save_path).parent.mkdir(parents=True, exist_ok=True)
             
-            # Save with high quality
-            fig.savefig(save_path, dpi=dpi, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
+            # Constrained layout already fits the content, so skip the extra
+            # bbox_inches='tight' render pass and use a cheaper encoder level
+            if Path(save_path).suffix.lower() in {'.jpg', '.jpeg'}:
+                pil_kwargs = {'quality': 85}
+            else:
+                pil_kwargs = {'compress_level': 3, 'optimize': False}
+            
+            fig.savefig(save_path, dpi=dpi, facecolor='white', edgecolor='none',
+                       pil_kwargs=pil_kwargs)
             print(f"Chart saved to: {save_path}")
             
         except Exception as e:
             print(f"Error saving chart: {e}")
 
 
+# ChartCreator instances kept by each worker process, keyed by figsize
+_WORKER_CREATORS: Dict[Tuple[float, float], 'ChartCreator'] = {}
+
+
+def _run_chart_task(task: Tuple) -> None:
+    """
+    Render one chart in a worker process using the Agg backend.
+    
+    Args:
+        task: Tuple of (figsize, method name, positional args, keyword args)
+    """
+    plt.switch_backend('Agg')
+    figsize, method_name, args, kwargs = task
+    # One creator per figure size and worker, so its figures are recycled
+    creator = _WORKER_CREATORS.get(figsize)
+    if creator is None:
+        creator = _WORKER_CREATORS[figsize] = ChartCreator(figsize=figsize,
+                                                           reuse_figures=True)
+    getattr(creator, method_name)(*args, **kwargs)
+
+
 def create_sample_data() -> pd.DataFrame:
     """
     Create sample data for chart demonstrations.
@@ -614,19 +978,26 @@ def create_sample_data() -> pd.DataFrame:
     np.random.seed(42)
     n_samples = 500
     
-    # Generate sample data
+    # Generate sample data with compact dtypes (float32, int8, category)
     data = {
         'date': pd.date_range('2023-01-01', periods=n_samples, freq='D'),
-        'sales': np.random.normal(1000, 200, n_samples) + 
-                np.sin(np.arange(n_samples) * 2 * np.pi / 365) * 100,
-        'temperature': np.random.normal(20, 10, n_samples),
-        'category': np.random.choice(['A', 'B', 'C', 'D'], n_samples, p=[0.3, 0.3, 0.2, 0.2]),
-        'score': np.random.normal(75, 15, n_samples),
-        'satisfaction': np.random.randint(1, 6, n_samples)
+        'sales': (np.random.normal(1000, 200, n_samples) + 
+                 np.sin(np.arange(n_samples) * 2 * np.pi / 365) * 100).astype(np.float32),
+        'temperature': np.random.normal(20, 10, n_samples).astype(np.float32),
+        'category': pd.Categorical(np.random.choice(['A', 'B', 'C', 'D'], n_samples,
+                                                    p=[0.3, 0.3, 0.2, 0.2])),
+        'score': np.random.normal(75, 15, n_samples).astype(np.float32),
+        'satisfaction': np.random.randint(1, 6, n_samples, dtype=np.int8)
     }
     
     # Add some correlation
-    data['revenue'] = data['sales'] * np.random.uniform(0.8, 1.2, n_samples)
+    data['revenue'] = (data['sales'] * np.random.uniform(0.8, 1.2, n_samples)).astype(np.float32)
+    
+    if pa is not None:
+        # Build columnar Arrow memory and hand one block per column to pandas,
+        # skipping the block-consolidation copy of pd.DataFrame(dict)
+        table = pa.table(data)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
     
     return pd.DataFrame(data)
 
@@ -646,6 +1017,9 @@ def main():
        
     3. Save charts:
        creator.create_scatter_plot(data, 'x', 'y', save_path='scatter.png')
+       
+    4. Headless batch run (Agg backend, no plot windows):
+       CHART_HEADLESS=1 python chart_creator.py
     """
     print("Chart Creator - Demonstration")
     print("=" * 40)
@@ -653,7 +1027,7 @@ def main():
     try:
         # Create sample data
         print("Creating sample dataset...")
-        data = create_sample_data()
+        data = _coerce_categoricals(create_sample_data())
         
         # Initialize chart creator
         creator = ChartCreator(figsize=(12, 8))
@@ -665,70 +1039,53 @@ def main():
         print(f"\nCreating various chart types...")
         print(f"Charts will be saved to: {output_dir.absolute()}")
         
-        # 1. Line Chart
-        print("1. Creating line chart...")
-        creator.create_line_chart(
-            data.head(50), 'date', 'sales',
-            title='Sales Trend Over Time',
-            save_path=output_dir / 'line_chart.png'
-        )
-        
-        # 2. Bar Chart
-        print("2. Creating bar chart...")
-        category_sales = data.groupby('category')['sales'].mean().reset_index()
-        creator.create_bar_chart(
-            category_sales, 'category', 'sales',
-            title='Average Sales by Category',
-            save_path=output_dir / 'bar_chart.png'
-        )
-        
-        # 3. Scatter Plot
-        print("3. Creating scatter plot...")
-        creator.create_scatter_plot(
-            data, 'temperature', 'sales',
-            title='Sales vs Temperature',
-            color_col='satisfaction',
-            save_path=output_dir / 'scatter_plot.png'
-        )
-        
-        # 4. Histogram
-        print("4. Creating histogram...")
-        creator.create_histogram(
-            data, 'score',
-            title='Score Distribution',
-            save_path=output_dir / 'histogram.png'
-        )
-        
-        # 5. Pie Chart
-        print("5. Creating pie chart...")
-        creator.create_pie_chart(
-            data, 'category',
-            title='Category Distribution',
-            save_path=output_dir / 'pie_chart.png'
-        )
-        
-        # 6. Box Plot
-        print("6. Creating box plot...")
-        creator.create_box_plot(
-            data, 'category', 'sales',
-            title='Sales Distribution by Category',
-            save_path=output_dir / 'box_plot.png'
-        )
-        
-        # 7. Heatmap
-        print("7. Creating correlation heatmap...")
-        creator.create_heatmap(
-            data,
-            title='Variable Correlations',
-            save_path=output_dir / 'heatmap.png'
-        )
-        
-        # 8. Dashboard
-        print("8. Creating multi-chart dashboard...")
-        creator.create_multi_chart_dashboard(
-            data,
-            save_path=output_dir / 'dashboard.png'
-        )
+        # One grouping of sales by category feeds the bar chart and dashboard
+        sales_by_category = data.groupby('category', observed=True)['sales']
+        category_sales = sales_by_category.mean().reset_index()
+        category_counts = sales_by_category.size()
+        
+        # Each chart is an independent (label, method, args, kwargs) task
+        tasks = [
+            ("line chart", 'create_line_chart', (data.head(50), 'date', 'sales'),
+             {'title': 'Sales Trend Over Time',
+              'save_path': output_dir / 'line_chart.png'}),
+            ("bar chart", 'create_bar_chart', (category_sales, 'category', 'sales'),
+             {'title': 'Average Sales by Category',
+              'save_path': output_dir / 'bar_chart.png'}),
+            ("scatter plot", 'create_scatter_plot', (data, 'temperature', 'sales'),
+             {'title': 'Sales vs Temperature', 'color_col': 'satisfaction',
+              'save_path': output_dir / 'scatter_plot.png'}),
+            ("histogram", 'create_histogram', (data, 'score'),
+             {'title': 'Score Distribution',
+              'save_path': output_dir / 'histogram.png'}),
+            ("pie chart", 'create_pie_chart', (data, 'category'),
+             {'title': 'Category Distribution',
+              'save_path': output_dir / 'pie_chart.png'}),
+            ("box plot", 'create_box_plot', (data, 'category', 'sales'),
+             {'title': 'Sales Distribution by Category',
+              'save_path': output_dir / 'box_plot.png'}),
+            ("correlation heatmap", 'create_heatmap', (data,),
+             {'title': 'Variable Correlations',
+              'save_path': output_dir / 'heatmap.png'}),
+            ("multi-chart dashboard", 'create_multi_chart_dashboard', (data,),
+             {'save_path': output_dir / 'dashboard.png',
+              'category_counts': category_counts}),
+        ]
+        
+        if HEADLESS:
+            # Charts are independent, so render them in parallel processes
+            for i, (label, *_) in enumerate(tasks, 1):
+                print(f"{i}. Creating {label}...")
+            
+            max_workers = min(len(tasks), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_run_chart_task,
+                                  [(creator.figsize,) + task[1:] for task in tasks]))
+        else:
+            # Interactive runs keep the figures in this process for plt.show()
+            for i, (label, method_name, args, kwargs) in enumerate(tasks, 1):
+                print(f"{i}. Creating {label}...")
+                getattr(creator, method_name)(*args, **kwargs)
         
         print(f"\nAll charts created successfully!")
         print(f"Check the '{output_dir}' directory for your visualizations.")
@@ -738,8 +1095,9 @@ def main():
         print(f"Shape: {data.shape}")
         print(f"Columns: {list(data.columns)}")
         
-        # Show the plots (comment out if running in non-interactive environment)
-        plt.show()
+        # Show the plots (skipped when running headless)
+        if not HEADLESS:
+            plt.show()
         
     except Exception as e:
         print(f"Error in main execution: {e}")
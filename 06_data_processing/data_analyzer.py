@@ -6,7 +6,7 @@ This script demonstrates various data analysis techniques using pandas,
 including data loading, cleaning, statistical analysis, and data manipulation.
 
 Author: Python Learning Series
-Dependencies: pandas, numpy
+Dependencies: pandas, numpy, numba (optional), pyarrow (optional), polars (optional)
 """
 
 import pandas as pd
@@ -15,22 +15,170 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    import polars as pl
+    import polars.selectors as cs
+except ImportError:
+    pl = None
+
+
+def _iqr_mask_loop(values: np.ndarray, lower: float, upper: float, out: np.ndarray):
+    """Flag values outside [lower, upper] into out in a single pass."""
+    for i in prange(values.shape[0]):
+        v = values[i]
+        out[i] = v < lower or v > upper
+
+
+def _zscore_mask_loop(values: np.ndarray, mean: float, std: float, out: np.ndarray):
+    """Flag values more than 3 standard deviations from mean into out."""
+    for i in prange(values.shape[0]):
+        out[i] = abs((values[i] - mean) / std) > 3
+
+
+def _iqr_mask_numpy(values: np.ndarray, lower: float, upper: float, out: np.ndarray):
+    """Same as _iqr_mask_loop using NumPy ufuncs (no Numba)."""
+    np.logical_or(values < lower, values > upper, out=out)
+
+
+def _zscore_mask_numpy(values: np.ndarray, mean: float, std: float, out: np.ndarray):
+    """Same as _zscore_mask_loop using NumPy ufuncs (no Numba)."""
+    np.greater(np.abs((values - mean) / std), 3, out=out)
+
+
+def _gram_loop(centered: np.ndarray, n_chunks: int) -> np.ndarray:
+    """
+    Accumulate the upper triangle of X^T X observation by observation.
+    
+    Each chunk of rows sums into its own k x k buffer (no shared writes),
+    and the partial buffers are added at the end.
+    
+    Args:
+        centered: (n, k) C-contiguous array of mean-centered columns
+        n_chunks: Number of row chunks processed in parallel
+        
+    Returns:
+        np.ndarray: (k, k) matrix with the upper triangle filled
+    """
+    n, k = centered.shape
+    partial = np.zeros((n_chunks, k, k))
+    chunk_size = (n + n_chunks - 1) // n_chunks
+    
+    for c in prange(n_chunks):
+        stop = min((c + 1) * chunk_size, n)
+        for t in range(c * chunk_size, stop):
+            for i in range(k):
+                xi = centered[t, i]
+                for j in range(i, k):
+                    partial[c, i, j] += xi * centered[t, j]
+    
+    gram = np.zeros((k, k))
+    for c in range(n_chunks):
+        gram += partial[c]
+    return gram
+
+
+def _parallel_corr(values: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation matrix of NaN-free columns using the Numba kernel.
+    
+    Args:
+        values: (n, k) float array
+        
+    Returns:
+        np.ndarray: (k, k) correlation matrix
+    """
+    centered = np.ascontiguousarray(values - values.mean(axis=0))
+    gram = _gram_kernel(centered, get_num_threads())
+    gram = np.triu(gram) + np.triu(gram, 1).T
+    std = np.sqrt(np.diag(gram))
+    return gram / np.outer(std, std)
+
+
+def _quartiles(values: np.ndarray) -> tuple:
+    """
+    Compute the 25th and 75th percentiles with a single partial sort.
+    
+    Uses the same linear interpolation as pandas' quantile and ignores NaNs.
+    
+    Args:
+        values: 1-D float array
+        
+    Returns:
+        Tuple of (Q1, Q3)
+    """
+    valid = values[~np.isnan(values)]
+    n = valid.size
+    if n == 0:
+        return np.nan, np.nan
+    
+    positions = np.array([0.25, 0.75]) * (n - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, n - 1)
+    part = np.partition(valid, np.unique(np.concatenate([lower, upper])))
+    q1, q3 = part[lower] + (positions - lower) * (part[upper] - part[lower])
+    return q1, q3
+
+
+# Compile the parallel kernels when Numba is installed (no fastmath: NaNs must compare False)
+if njit is not None:
+    _iqr_mask = njit(parallel=True, cache=True)(_iqr_mask_loop)
+    _zscore_mask = njit(parallel=True, cache=True)(_zscore_mask_loop)
+    _gram_kernel = njit(parallel=True, cache=True, fastmath=True)(_gram_loop)
+else:
+    _iqr_mask = _iqr_mask_numpy
+    _zscore_mask = _zscore_mask_numpy
+    _gram_kernel = None
+
+
+def _iqr_outliers(values: np.ndarray, out: np.ndarray):
+    """Flag values outside 1.5 * IQR of the quartiles into out."""
+    q1, q3 = _quartiles(values)
+    iqr = q3 - q1
+    _iqr_mask(values, q1 - 1.5 * iqr, q3 + 1.5 * iqr, out)
+
+
+def _zscore_outliers(values: np.ndarray, out: np.ndarray):
+    """Flag values with |z| > 3 (NaN-aware mean and sample std) into out."""
+    _zscore_mask(values, np.nanmean(values), np.nanstd(values, ddof=1), out)
+
+
+# Outlier detection methods by name, used by DataAnalyzer.find_outliers
+_OUTLIER_METHODS = {
+    'iqr': _iqr_outliers,       # Interquartile Range method
+    'zscore': _zscore_outliers  # Z-score method (assuming normal distribution)
+}
+
 
 class DataAnalyzer:
     """
     A comprehensive data analysis class that provides methods for loading,
     cleaning, and analyzing datasets using pandas.
+    
+    With backend='polars' the data is kept as a Polars LazyFrame: descriptive
+    statistics, correlations and group analysis run as lazy queries, and the
+    other methods collect the data into pandas on first use.
     """
     
-    def __init__(self, data: Optional[Union[str, pd.DataFrame]] = None):
+    def __init__(self, data: Optional[Union[str, pd.DataFrame]] = None,
+                 backend: str = 'pandas'):
         """
         Initialize the DataAnalyzer.
         
         Args:
             data: Path to CSV file or pandas DataFrame
+            backend: 'pandas' (eager) or 'polars' (lazy scan)
         """
+        self.backend = backend
         self.df = None
-        self.original_df = None
+        self.lf = None
+        self._original_shape = None
+        self._invalidate_cache()
         
         if data is not None:
             self.load_data(data)
@@ -46,25 +194,39 @@ class DataAnalyzer:
             bool: True if data loaded successfully, False otherwise
         """
         try:
+            if self.backend == 'polars':
+                return self._load_lazy(source)
+            
+            self.lf = None
             if isinstance(source, str):
                 # Load from CSV file
                 if not Path(source).exists():
                     print(f"Error: File '{source}' not found.")
                     return False
                 
-                self.df = pd.read_csv(source)
+                try:
+                    # Multithreaded Arrow parser, converted to regular NumPy dtypes
+                    self.df = pd.read_csv(source, engine='pyarrow')
+                except ImportError:
+                    self.df = pd.read_csv(source)
                 print(f"Successfully loaded data from '{source}'")
                 
             elif isinstance(source, pd.DataFrame):
-                # Load from DataFrame
-                self.df = source.copy()
+                # Load from DataFrame (Arrow buffers are immutable, so share them)
+                arrow_dtype = getattr(pd, 'ArrowDtype', None)
+                if arrow_dtype is not None and any(isinstance(dtype, arrow_dtype)
+                                                   for dtype in source.dtypes):
+                    self.df = source.copy(deep=False)
+                else:
+                    self.df = source.copy()
                 print("Successfully loaded DataFrame")
                 
             else:
                 raise ValueError("Source must be a file path (str) or pandas DataFrame")
             
-            # Keep a copy of original data
-            self.original_df = self.df.copy()
+            # Only the original shape is reported later, so don't copy the data
+            self._original_shape = self.df.shape
+            self._invalidate_cache()
             print(f"Dataset shape: {self.df.shape}")
             return True
             
@@ -72,15 +234,147 @@ class DataAnalyzer:
             print(f"Error loading data: {e}")
             return False
     
-    def get_basic_info(self) -> Dict:
+    def _load_lazy(self, source: Union[str, pd.DataFrame]) -> bool:
         """
-        Get basic information about the dataset.
+        Load data as a Polars LazyFrame without reading it yet.
         
+        Args:
+            source: Path to CSV file or pandas DataFrame
+            
         Returns:
-            Dict: Dictionary containing basic dataset information
+            bool: True if the scan was set up successfully
+        """
+        if pl is None:
+            raise ImportError("backend='polars' requires the polars package")
+        
+        if isinstance(source, str):
+            if not Path(source).exists():
+                print(f"Error: File '{source}' not found.")
+                return False
+            self.lf = pl.scan_csv(source)
+            print(f"Successfully set up lazy scan of '{source}'")
+            
+        elif isinstance(source, pd.DataFrame):
+            self.lf = pl.from_pandas(source).lazy()
+            print("Successfully loaded DataFrame into Polars")
+            
+        else:
+            raise ValueError("Source must be a file path (str) or pandas DataFrame")
+        
+        self.df = None
+        self._original_shape = None
+        self._invalidate_cache()
+        return True
+    
+    def _ensure_pandas(self) -> bool:
         """
+        Make sure self.df is available, collecting the lazy Polars data if needed.
+        
+        Returns:
+            bool: True if data is loaded
+        """
+        if self.df is None and self.lf is not None:
+            self.df = self.lf.collect().to_pandas()
+            self._original_shape = self.df.shape
+        
         if self.df is None:
             print("No data loaded. Please load data first.")
+            return False
+        return True
+    
+    def _columns(self) -> List[str]:
+        """Get the column names of the loaded data (lazy or pandas)."""
+        if self.lf is not None:
+            return self.lf.collect_schema().names()
+        return list(self.df.columns)
+    
+    def _invalidate_cache(self):
+        """Reset cached results derived from self.df after it changes."""
+        self._numeric_cols = None
+        self._describe_cache = {}
+        self._corr_cache = {}
+    
+    def _numeric_columns(self) -> pd.Index:
+        """
+        Get the numeric column names, computed once per dataset.
+        
+        Returns:
+            pd.Index: Names of the numeric columns
+        """
+        if self._numeric_cols is None:
+            if self.lf is not None:
+                self._numeric_cols = pd.Index(
+                    self.lf.select(cs.numeric()).collect_schema().names())
+            else:
+                self._numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        return self._numeric_cols
+    
+    def _describe(self, numeric_only: bool = True) -> pd.DataFrame:
+        """
+        Get describe() output, computed once per dataset and mode.
+        
+        Args:
+            numeric_only: Whether to include only numeric columns
+            
+        Returns:
+            pd.DataFrame: Descriptive statistics
+        """
+        if numeric_only not in self._describe_cache:
+            if self.lf is not None:
+                frame = self.lf.select(cs.numeric()) if numeric_only else self.lf
+                stats = frame.describe()
+                self._describe_cache[numeric_only] = pd.DataFrame(
+                    stats.to_dict(as_series=False)).set_index('statistic')
+            elif numeric_only:
+                self._describe_cache[numeric_only] = self.df.describe()
+            else:
+                self._describe_cache[numeric_only] = self.df.describe(include='all')
+        return self._describe_cache[numeric_only]
+    
+    def optimize_dtypes(self) -> bool:
+        """
+        Downcast numeric columns and convert low-cardinality text to category.
+        
+        Returns:
+            bool: True if optimization successful
+        """
+        if not self._ensure_pandas():
+            return False
+        
+        try:
+            before = self.df.memory_usage().sum()
+            
+            for col in self.df.select_dtypes(include=['integer']).columns:
+                self.df[col] = pd.to_numeric(self.df[col], downcast='integer')
+            for col in self.df.select_dtypes(include=['floating']).columns:
+                self.df[col] = pd.to_numeric(self.df[col], downcast='float')
+            for col in self.df.select_dtypes(include=['object']).columns:
+                if self.df[col].nunique() / len(self.df) < 0.5:
+                    self.df[col] = self.df[col].astype('category')
+            
+            self._invalidate_cache()
+            after = self.df.memory_usage().sum()
+            print(f"Optimized dtypes: {before / 1024:.2f} KB → {after / 1024:.2f} KB")
+            return True
+            
+        except Exception as e:
+            print(f"Error optimizing dtypes: {e}")
+            return False
+    
+    def get_basic_info(self, deep_memory: bool = False,
+                       count_duplicates: bool = False) -> Dict:
+        """
+        Get basic information about the dataset.
+        
+        Args:
+            deep_memory: Whether to measure the size of Python objects in
+                object columns (slow on large text columns)
+            count_duplicates: Whether to count duplicate rows (hashes every row)
+        
+        Returns:
+            Dict: Dictionary containing basic dataset information
+        """
+        if not self._ensure_pandas():
             return {}
         
         try:
@@ -88,15 +382,16 @@ class DataAnalyzer:
                 'shape': self.df.shape,
                 'columns': list(self.df.columns),
                 'dtypes': dict(self.df.dtypes),
-                'memory_usage': self.df.memory_usage(deep=True).sum(),
+                'memory_usage': self.df.memory_usage(deep=deep_memory).sum(),
                 'null_values': dict(self.df.isnull().sum()),
-                'duplicate_rows': self.df.duplicated().sum()
+                'duplicate_rows': self.df.duplicated().sum() if count_duplicates else None
             }
             
             print("=== DATASET BASIC INFORMATION ===")
             print(f"Shape: {info['shape'][0]} rows × {info['shape'][1]} columns")
             print(f"Memory usage: {info['memory_usage'] / 1024:.2f} KB")
-            print(f"Duplicate rows: {info['duplicate_rows']}")
+            if count_duplicates:
+                print(f"Duplicate rows: {info['duplicate_rows']}")
             print(f"Columns with null values: {sum(1 for v in info['null_values'].values() if v > 0)}")
             
             return info
@@ -115,15 +410,12 @@ class DataAnalyzer:
         Returns:
             pd.DataFrame: Descriptive statistics
         """
-        if self.df is None:
+        if self.df is None and self.lf is None:
             print("No data loaded. Please load data first.")
             return None
         
         try:
-            if numeric_only:
-                stats = self.df.describe()
-            else:
-                stats = self.df.describe(include='all')
+            stats = self._describe(numeric_only)
             
             print("=== DESCRIPTIVE STATISTICS ===")
             print(stats)
@@ -144,40 +436,41 @@ class DataAnalyzer:
         Returns:
             pd.Series: Boolean series indicating outliers
         """
-        if self.df is None or column not in self.df.columns:
+        if not self._ensure_pandas():
+            return None
+        
+        if column not in self.df.columns:
             print(f"Column '{column}' not found in dataset.")
             return None
         
-        if not pd.api.types.is_numeric_dtype(self.df[column]):
+        if column not in self._numeric_columns():
             print(f"Column '{column}' is not numeric.")
             return None
         
         try:
-            if method.lower() == 'iqr':
-                # Interquartile Range method
-                Q1 = self.df[column].quantile(0.25)
-                Q3 = self.df[column].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                outliers = (self.df[column] < lower_bound) | (self.df[column] > upper_bound)
-                
-            elif method.lower() == 'zscore':
-                # Z-score method (assuming normal distribution)
-                z_scores = np.abs((self.df[column] - self.df[column].mean()) / self.df[column].std())
-                outliers = z_scores > 3
-                
+            detect = _OUTLIER_METHODS.get(method.lower())
+            if detect is None:
+                raise ValueError(f"Method must be one of: {', '.join(_OUTLIER_METHODS)}")
+            
+            # Convert the column once (zero-copy for float64 NumPy columns)
+            series = self.df[column]
+            if isinstance(series.dtype, np.dtype):
+                values = series.to_numpy(dtype=float)
             else:
-                raise ValueError("Method must be 'iqr' or 'zscore'")
+                values = series.to_numpy(dtype=float, na_value=np.nan)
+            
+            mask = np.empty(values.shape[0], dtype=bool)
+            detect(values, mask)
             
-            outlier_count = outliers.sum()
+            outlier_count = int(mask.sum())
             print(f"Found {outlier_count} outliers in column '{column}' using {method.upper()} method")
             
             if outlier_count > 0:
                 print("Outlier values:")
-                print(self.df[outliers][column].values)
+                print(values[mask])
             
-            return outliers
+            # Wrap back into a Series only for the caller
+            return pd.Series(mask, index=self.df.index, name=column)
             
         except Exception as e:
             print(f"Error finding outliers: {e}")
@@ -193,33 +486,50 @@ class DataAnalyzer:
         Returns:
             pd.DataFrame: Correlation matrix
         """
-        if self.df is None:
+        if self.df is None and self.lf is None:
             print("No data loaded. Please load data first.")
             return None
         
         try:
-            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+            numeric_cols = self._numeric_columns()
             
             if len(numeric_cols) < 2:
                 print("Need at least 2 numeric columns for correlation analysis.")
                 return None
             
-            corr_matrix = self.df[numeric_cols].corr(method=method)
+            if method not in self._corr_cache:
+                if self.lf is not None and method in ('pearson', 'spearman'):
+                    self._corr_cache[method] = self._lazy_corr(list(numeric_cols), method)
+                else:
+                    self._ensure_pandas()
+                    values = self.df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+                    if method == 'pearson' and not np.isnan(values).any():
+                        # Without NaNs pairwise masking is unnecessary: tall, narrow data
+                        # uses the parallel kernel, otherwise one corrcoef call
+                        n_rows, n_cols = values.shape
+                        if _gram_kernel is not None and n_cols <= 64 and n_rows >= 10_000:
+                            corr = _parallel_corr(values)
+                        else:
+                            corr = np.corrcoef(values, rowvar=False)
+                        self._corr_cache[method] = pd.DataFrame(
+                            corr, index=numeric_cols, columns=numeric_cols)
+                    else:
+                        self._corr_cache[method] = self.df[numeric_cols].corr(method=method)
+            corr_matrix = self._corr_cache[method]
             
             print(f"=== CORRELATION MATRIX ({method.upper()}) ===")
             print(corr_matrix.round(3))
             
-            # Find strong correlations (> 0.7 or < -0.7)
-            strong_corr = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        strong_corr.append((
-                            corr_matrix.columns[i],
-                            corr_matrix.columns[j],
-                            corr_val
-                        ))
+            # Find strong correlations (> 0.7 or < -0.7) in the upper triangle
+            values = corr_matrix.to_numpy()
+            rows, cols = np.triu_indices(values.shape[0], k=1)
+            upper = values[rows, cols]
+            mask = np.abs(upper) > 0.7
+            strong_corr = list(zip(
+                corr_matrix.columns[rows[mask]],
+                corr_matrix.columns[cols[mask]],
+                upper[mask]
+            ))
             
             if strong_corr:
                 print("\n=== STRONG CORRELATIONS (|r| > 0.7) ===")
@@ -232,6 +542,23 @@ class DataAnalyzer:
             print(f"Error analyzing correlations: {e}")
             return None
     
+    def _lazy_corr(self, columns: List[str], method: str) -> pd.DataFrame:
+        """
+        Compute a correlation matrix with a Polars lazy query.
+        
+        Rows containing nulls are dropped; Spearman is Pearson on ranks.
+        
+        Args:
+            columns: Numeric columns to correlate
+            method: 'pearson' or 'spearman'
+            
+        Returns:
+            pd.DataFrame: Correlation matrix
+        """
+        exprs = [pl.col(c).rank() if method == 'spearman' else pl.col(c) for c in columns]
+        frame = self.lf.select(columns).drop_nulls().select(exprs).collect()
+        return pd.DataFrame(frame.corr().to_numpy(), index=columns, columns=columns)
+    
     def group_analysis(self, group_by: str, target_col: str, 
                       agg_functions: List[str] = None) -> Optional[pd.DataFrame]:
         """
@@ -245,11 +572,12 @@ class DataAnalyzer:
         Returns:
             pd.DataFrame: Grouped analysis results
         """
-        if self.df is None:
+        if self.df is None and self.lf is None:
             print("No data loaded. Please load data first.")
             return None
         
-        if group_by not in self.df.columns or target_col not in self.df.columns:
+        columns = self._columns()
+        if group_by not in columns or target_col not in columns:
             print("Specified columns not found in dataset.")
             return None
         
@@ -257,7 +585,14 @@ class DataAnalyzer:
             agg_functions = ['count', 'mean', 'std', 'min', 'max']
         
         try:
-            grouped = self.df.groupby(group_by)[target_col].agg(agg_functions)
+            if self.lf is not None:
+                aggs = [getattr(pl.col(target_col), fn)().alias(fn) for fn in agg_functions]
+                result = self.lf.group_by(group_by).agg(aggs).sort(group_by).collect()
+                grouped = pd.DataFrame(result.to_dict(as_series=False)).set_index(group_by)
+            else:
+                # Category columns (e.g. after optimize_dtypes) group on their
+                # integer codes; observed=True skips unused levels
+                grouped = self.df.groupby(group_by, observed=True)[target_col].agg(agg_functions)
             
             print(f"=== GROUP ANALYSIS: {group_by} → {target_col} ===")
             print(grouped)
@@ -268,6 +603,86 @@ class DataAnalyzer:
             print(f"Error in group analysis: {e}")
             return None
     
+    def summarize(self, group_by: str = None, target_col: str = None) -> Dict:
+        """
+        Compute shape, null counts, statistics, correlations and an optional
+        group analysis with Polars, sharing one scan of each column.
+        
+        Args:
+            group_by: Column to group by (optional)
+            target_col: Target column for the group aggregation
+            
+        Returns:
+            Dict: Summary with 'shape', 'null_values', 'statistics',
+            'correlations' and, if requested, 'groups'
+        """
+        if pl is None:
+            print("Summarize requires the polars package.")
+            return {}
+        
+        if self.df is None and self.lf is None:
+            print("No data loaded. Please load data first.")
+            return {}
+        
+        try:
+            lf = self.lf if self.lf is not None else pl.from_pandas(self.df).lazy()
+            columns = self._columns()
+            numeric = list(self._numeric_columns())
+            pairs = [(a, b) for i, a in enumerate(numeric) for b in numeric[i + 1:]]
+            
+            exprs = [pl.len().alias('rows')]
+            exprs += [pl.col(c).null_count().alias(f'{c}|nulls') for c in columns]
+            for stat in ('count', 'mean', 'std', 'min', 'max'):
+                exprs += [getattr(pl.col(c), stat)().cast(pl.Float64).alias(f'{c}|{stat}')
+                          for c in numeric]
+            exprs += [pl.corr(a, b).alias(f'{a}|{b}') for a, b in pairs]
+            
+            # All aggregations go into one plan; collect_all shares the scan
+            queries = [lf.select(exprs)]
+            if group_by and target_col:
+                aggs = [getattr(pl.col(target_col), fn)().alias(fn)
+                        for fn in ('count', 'mean', 'std', 'min', 'max')]
+                queries.append(lf.group_by(group_by).agg(aggs).sort(group_by))
+            results = pl.collect_all(queries)
+            row = results[0].row(0, named=True)
+            
+            # pairs are in row-major upper-triangle order, like np.triu_indices
+            corr = np.eye(len(numeric))
+            upper_rows, upper_cols = np.triu_indices(len(numeric), k=1)
+            corr[upper_rows, upper_cols] = np.array([row[f'{a}|{b}'] for a, b in pairs],
+                                                    dtype=float)
+            corr[upper_cols, upper_rows] = corr[upper_rows, upper_cols]
+            
+            summary = {
+                'shape': (row['rows'], len(columns)),
+                'null_values': {c: row[f'{c}|nulls'] for c in columns},
+                'statistics': pd.DataFrame(
+                    {c: [row[f'{c}|{stat}'] for stat in ('count', 'mean', 'std', 'min', 'max')]
+                     for c in numeric},
+                    index=['count', 'mean', 'std', 'min', 'max']),
+                'correlations': pd.DataFrame(corr, index=numeric, columns=numeric)
+            }
+            if len(results) > 1:
+                summary['groups'] = pd.DataFrame(
+                    results[1].to_dict(as_series=False)).set_index(group_by)
+            
+            print("=== DATASET SUMMARY ===")
+            print(f"Shape: {summary['shape'][0]} rows × {summary['shape'][1]} columns")
+            print(f"Columns with null values: {sum(1 for v in summary['null_values'].values() if v > 0)}")
+            print("\nStatistics:")
+            print(summary['statistics'])
+            print("\nCorrelations:")
+            print(summary['correlations'].round(3))
+            if 'groups' in summary:
+                print(f"\nGroups: {group_by} → {target_col}")
+                print(summary['groups'])
+            
+            return summary
+            
+        except Exception as e:
+            print(f"Error summarizing data: {e}")
+            return {}
+    
     def clean_data(self, drop_duplicates: bool = True, 
                    handle_nulls: str = 'drop') -> bool:
         """
@@ -280,10 +695,12 @@ class DataAnalyzer:
         Returns:
             bool: True if cleaning successful
         """
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+        if not self._ensure_pandas():
             return False
         
+        # Later analysis must see the cleaned data, not the original scan
+        self.lf = None
+        
         try:
             initial_shape = self.df.shape
             
@@ -291,28 +708,34 @@ class DataAnalyzer:
             if drop_duplicates:
                 duplicates_count = self.df.duplicated().sum()
                 self.df = self.df.drop_duplicates()
+                self._invalidate_cache()
                 print(f"Dropped {duplicates_count} duplicate rows")
             
             # Handle null values
-            null_count = self.df.isnull().sum().sum()
+            # Count NaNs on the numeric block in one pass, other columns via isna
+            numeric_cols = self._numeric_columns()
+            numeric_values = self.df[numeric_cols].to_numpy(dtype=float, na_value=np.nan)
+            null_count = int(np.isnan(numeric_values).sum())
+            other_cols = self.df.columns.difference(numeric_cols, sort=False)
+            if len(other_cols):
+                null_count += int(self.df[other_cols].isna().to_numpy().sum())
             if null_count > 0:
                 if handle_nulls == 'drop':
                     self.df = self.df.dropna()
+                    self._invalidate_cache()
                     print(f"Dropped rows with null values")
                     
-                elif handle_nulls == 'fill_mean':
-                    numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-                    self.df[numeric_cols] = self.df[numeric_cols].fillna(
-                        self.df[numeric_cols].mean()
-                    )
-                    print("Filled null values with column means")
+                elif handle_nulls in ('fill_mean', 'fill_median'):
+                    # One 2-D NaN-aware reduction, then a single per-column fillna
+                    if handle_nulls == 'fill_mean':
+                        fill_values = np.nanmean(numeric_values, axis=0)
+                    else:
+                        fill_values = np.nanmedian(numeric_values, axis=0)
+                    self.df = self.df.fillna(dict(zip(numeric_cols, fill_values)))
+                    self._invalidate_cache()
                     
-                elif handle_nulls == 'fill_median':
-                    numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-                    self.df[numeric_cols] = self.df[numeric_cols].fillna(
-                        self.df[numeric_cols].median()
-                    )
-                    print("Filled null values with column medians")
+                    stat_name = 'means' if handle_nulls == 'fill_mean' else 'medians'
+                    print(f"Filled null values with column {stat_name}")
             
             final_shape = self.df.shape
             print(f"Data cleaned: {initial_shape} → {final_shape}")
@@ -334,8 +757,7 @@ class DataAnalyzer:
         Returns:
             bool: True if export successful
         """
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+        if not self._ensure_pandas():
             return False
         
         try:
@@ -350,11 +772,11 @@ class DataAnalyzer:
                     f.write("DATASET ANALYSIS REPORT\n")
                     f.write("=" * 50 + "\n\n")
                     
-                    f.write(f"Original shape: {self.original_df.shape}\n")
+                    f.write(f"Original shape: {self._original_shape}\n")
                     f.write(f"Cleaned shape: {self.df.shape}\n\n")
                     
                     f.write("DESCRIPTIVE STATISTICS:\n")
-                    f.write(str(self.df.describe()))
+                    f.write(str(self._describe()))
                     
                 print(f"Statistics exported to '{stats_filename}'")
             
@@ -380,7 +802,7 @@ def create_sample_data() -> pd.DataFrame:
         'income': np.random.normal(50000, 15000, n_samples),
         'education_years': np.random.randint(8, 20, n_samples),
         'experience': np.random.randint(0, 40, n_samples),
-        'category': np.random.choice(['A', 'B', 'C'], n_samples),
+        'category': pd.Categorical(np.random.choice(['A', 'B', 'C'], n_samples)),
         'score': np.random.normal(75, 10, n_samples)
     }
     
@@ -402,6 +824,9 @@ def main():
     2. Load from CSV file:
        analyzer = DataAnalyzer('your_data.csv')
        
+       Or as a lazy Polars scan:
+       analyzer = DataAnalyzer('your_data.csv', backend='polars')
+       
     3. Perform specific analysis:
        analyzer.get_basic_info()
        analyzer.get_descriptive_statistics()
@@ -417,35 +842,41 @@ def main():
         
         # Initialize analyzer
         analyzer = DataAnalyzer(sample_data)
+        analyzer.optimize_dtypes()
         
-        # Perform comprehensive analysis
-        print("\n1. BASIC INFORMATION")
-        print("-" * 20)
-        analyzer.get_basic_info()
+        step = iter(range(1, 10))
         
-        print("\n2. DESCRIPTIVE STATISTICS")
-        print("-" * 25)
-        analyzer.get_descriptive_statistics()
+        def section(title: str):
+            header = f"{next(step)}. {title}"
+            print(f"\n{header}")
+            print("-" * len(header))
         
-        print("\n3. OUTLIER DETECTION")
-        print("-" * 20)
+        # Perform comprehensive analysis
+        if pl is not None:
+            # Shape, statistics, correlations and groups from one fused query
+            section("DATASET SUMMARY")
+            analyzer.summarize('category', 'income')
+        else:
+            section("BASIC INFORMATION")
+            analyzer.get_basic_info()
+            
+            section("DESCRIPTIVE STATISTICS")
+            analyzer.get_descriptive_statistics()
+            
+            section("CORRELATION ANALYSIS")
+            analyzer.analyze_correlations()
+            
+            section("GROUP ANALYSIS")
+            analyzer.group_analysis('category', 'income')
+        
+        section("OUTLIER DETECTION")
         analyzer.find_outliers('income', 'iqr')
         analyzer.find_outliers('score', 'zscore')
         
-        print("\n4. CORRELATION ANALYSIS")
-        print("-" * 23)
-        analyzer.analyze_correlations()
-        
-        print("\n5. GROUP ANALYSIS")
-        print("-" * 17)
-        analyzer.group_analysis('category', 'income')
-        
-        print("\n6. DATA CLEANING")
-        print("-" * 16)
+        section("DATA CLEANING")
         analyzer.clean_data(drop_duplicates=True, handle_nulls='fill_mean')
         
-        print("\n7. EXPORT RESULTS")
-        print("-" * 16)
+        section("EXPORT RESULTS")
         output_file = "analysis_results.csv"
         analyzer.export_results(output_file)
         
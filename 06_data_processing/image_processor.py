@@ -6,16 +6,406 @@ This script demonstrates various image processing techniques using the Python
 Imaging Library (PIL/Pillow) for common image manipulation tasks.
 
 Author: Python Learning Series
-Dependencies: Pillow, numpy
+Dependencies: Pillow, numpy, numba (optional)
+
+Performance note: the resize, filter, point and alpha_composite kernels used
+here are much faster with Pillow-SIMD, a drop-in fork of Pillow with SSE4/AVX2
+implementations. It is optional; install it in place of Pillow with
+    pip uninstall pillow && pip install pillow-simd
 """
 
+import PIL
 from PIL import Image, ImageFilter, ImageEnhance, ImageDraw, ImageFont
 import numpy as np
 from pathlib import Path
 from typing import Tuple, List, Optional, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 import io
+import math
+import os
 import sys
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _fill_gradient_loop(out: np.ndarray, width: int, height: int):
+    """Write the sample RGB gradient into out, one row per parallel task."""
+    for y in prange(height):
+        for x in range(width):
+            out[y, x, 0] = (255 * x) // width
+            out[y, x, 1] = (255 * y) // height
+            out[y, x, 2] = (255 * (x + y)) // (width + height)
+
+
+def _fill_gradient_numpy(out: np.ndarray, width: int, height: int):
+    """Same as _fill_gradient_loop using NumPy broadcasting (no Numba)."""
+    x = np.arange(width, dtype=np.uint32)[None, :]
+    y = np.arange(height, dtype=np.uint32)[:, None]
+    out[..., 0] = 255 * x // width
+    out[..., 1] = 255 * y // height
+    out[..., 2] = 255 * (x + y) // (width + height)
+
+
+def _img_stats_loop(flat: np.ndarray) -> tuple:
+    """Return (min, max, sum, sum of squares) of a 1-D uint8 array in one pass."""
+    mn = 255
+    mx = 0
+    total = 0
+    sumsq = 0
+    for i in prange(flat.shape[0]):
+        v = np.int64(flat[i])
+        mn = min(mn, v)
+        mx = max(mx, v)
+        total += v
+        sumsq += v * v
+    return mn, mx, total, sumsq
+
+
+def _img_stats_numpy(flat: np.ndarray) -> tuple:
+    """Same as _img_stats_loop using NumPy reductions (no Numba)."""
+    # Accumulate in uint64 straight from the uint8 data; only the squares
+    # need a (4-byte) temporary, instead of a full float64 or int64 copy
+    total = flat.sum(dtype=np.uint64)
+    sumsq = np.square(flat, dtype=np.uint32).sum(dtype=np.uint64)
+    return flat.min(), flat.max(), int(total), int(sumsq)
+
+
+# Pillow-SIMD releases are versioned as '<pillow version>.postN'
+PILLOW_SIMD = '.post' in PIL.__version__
+
+
+# Compile the pixel kernels when Numba is installed
+if njit is not None:
+    _fill_gradient = njit(parallel=True, cache=True)(_fill_gradient_loop)
+    _img_stats = njit(parallel=True, cache=True)(_img_stats_loop)
+else:
+    _fill_gradient = _fill_gradient_numpy
+    _img_stats = _img_stats_numpy
+
+
+def _flatten_alpha(img: Image.Image) -> Image.Image:
+    """Blend an RGBA image onto white in one vectorized pass and return RGB."""
+    rgba = np.asarray(img)
+    alpha = rgba[..., 3:4].astype(np.uint16)
+    
+    # rgb * a + 255 * (255 - a) fits in uint16; divide by 255 with rounding
+    blended = np.empty(rgba.shape[:2] + (3,), dtype=np.uint16)
+    np.multiply(rgba[..., :3], alpha, out=blended)
+    blended += 255 * (255 - alpha)
+    blended += 127
+    np.floor_divide(blended, 255, out=blended)
+    return Image.fromarray(blended.astype(np.uint8), 'RGB')
+
+
+# Pure image operations: each takes an image and returns a new one, leaving
+# the input untouched. Invalid arguments raise ValueError.
+
+def op_resize(img: Image.Image, width: int, height: int,
+              maintain_aspect: bool = True) -> Image.Image:
+    """Resize img to (width, height), optionally fitting it inside that box."""
+    original_width, original_height = img.size
+    
+    if maintain_aspect:
+        # Calculate aspect ratio preserving dimensions
+        aspect_ratio = original_width / original_height
+        
+        if width / height > aspect_ratio:
+            # Height is the limiting factor
+            width = int(height * aspect_ratio)
+        else:
+            # Width is the limiting factor
+            height = int(width / aspect_ratio)
+    
+    # Pick the resampling filter from the scale ratio: BOX is indistinguishable
+    # from LANCZOS on heavy downscales, and BICUBIC is cheaper for upscales
+    ratio = max(original_width / width, original_height / height)
+    if ratio > 4:
+        resample = Image.Resampling.BOX
+    elif ratio > 1:
+        resample = Image.Resampling.LANCZOS
+    else:
+        resample = Image.Resampling.BICUBIC
+    
+    # reducing_gap lets Pillow shrink by an integer factor first, then finish
+    return img.resize((width, height), resample, reducing_gap=2.0)
+
+
+# Single transpose equivalent to (flip horizontally, flip vertically, then
+# rotate counterclockwise by 0/90/180/270 degrees); None means identity
+_ORIENTATIONS = {
+    (False, False, 0): None,
+    (False, False, 90): Image.Transpose.ROTATE_90,
+    (False, False, 180): Image.Transpose.ROTATE_180,
+    (False, False, 270): Image.Transpose.ROTATE_270,
+    (False, True, 0): Image.Transpose.FLIP_TOP_BOTTOM,
+    (False, True, 90): Image.Transpose.TRANSVERSE,
+    (False, True, 180): Image.Transpose.FLIP_LEFT_RIGHT,
+    (False, True, 270): Image.Transpose.TRANSPOSE,
+    (True, False, 0): Image.Transpose.FLIP_LEFT_RIGHT,
+    (True, False, 90): Image.Transpose.TRANSPOSE,
+    (True, False, 180): Image.Transpose.FLIP_TOP_BOTTOM,
+    (True, False, 270): Image.Transpose.TRANSVERSE,
+    (True, True, 0): Image.Transpose.ROTATE_180,
+    (True, True, 90): Image.Transpose.ROTATE_270,
+    (True, True, 180): None,
+    (True, True, 270): Image.Transpose.ROTATE_90,
+}
+
+
+def op_transpose_orientation(img: Image.Image, flip_h: bool = False, flip_v: bool = False,
+                             rot: int = 0) -> Image.Image:
+    """Flip and rotate img by a multiple of 90 degrees in one transpose."""
+    if rot % 90 != 0:
+        raise ValueError("Rotation must be a multiple of 90 degrees")
+    
+    method = _ORIENTATIONS[(bool(flip_h), bool(flip_v), int(rot) % 360)]
+    return img.copy() if method is None else img.transpose(method)
+
+
+def op_rotate(img: Image.Image, angle: float, expand: bool = True) -> Image.Image:
+    """Rotate img counterclockwise by angle degrees."""
+    # Quarter turns are pure pixel reordering; skip the affine resampler.
+    # Without expand, 90/270 on a non-square image must keep its size.
+    if angle % 90 == 0 and (expand or angle % 180 == 0 or img.width == img.height):
+        return op_transpose_orientation(img, rot=int(angle))
+    return img.rotate(angle, expand=expand, fillcolor='white')
+
+
+def op_flip(img: Image.Image, direction: str = 'horizontal') -> Image.Image:
+    """Flip img horizontally or vertically."""
+    if direction.lower() == 'horizontal':
+        return img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    if direction.lower() == 'vertical':
+        return img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    raise ValueError("Direction must be 'horizontal' or 'vertical'")
+
+
+def op_crop(img: Image.Image, left: int, top: int, right: int, bottom: int) -> Image.Image:
+    """Crop img to the (left, top, right, bottom) box."""
+    width, height = img.size
+    
+    if left < 0 or top < 0 or right > width or bottom > height:
+        raise ValueError("Crop coordinates are outside image boundaries")
+    
+    if left >= right or top >= bottom:
+        raise ValueError("Invalid crop coordinates")
+    
+    return img.crop((left, top, right, bottom))
+
+
+# Named filters accepted by op_filter
+_FILTERS = {
+    'blur': ImageFilter.BLUR,
+    'detail': ImageFilter.DETAIL,
+    'edge_enhance': ImageFilter.EDGE_ENHANCE,
+    'edge_enhance_more': ImageFilter.EDGE_ENHANCE_MORE,
+    'emboss': ImageFilter.EMBOSS,
+    'find_edges': ImageFilter.FIND_EDGES,
+    'sharpen': ImageFilter.SHARPEN,
+    'smooth': ImageFilter.SMOOTH,
+    'smooth_more': ImageFilter.SMOOTH_MORE,
+    'contour': ImageFilter.CONTOUR
+}
+
+# Watermark anchors as functions of (image width, image height, text width, text height)
+_WATERMARK_POSITIONS = {
+    'top-left': lambda w, h, tw, th: (10, 10),
+    'top-right': lambda w, h, tw, th: (w - tw - 10, 10),
+    'bottom-left': lambda w, h, tw, th: (10, h - th - 10),
+    'bottom-right': lambda w, h, tw, th: (w - tw - 10, h - th - 10),
+    'center': lambda w, h, tw, th: (w // 2 - tw // 2, h // 2 - th // 2)
+}
+
+
+def op_filter(img: Image.Image, filter_type: str) -> Image.Image:
+    """Apply a named ImageFilter to img."""
+    if filter_type.lower() not in _FILTERS:
+        available_filters = ', '.join(_FILTERS.keys())
+        raise ValueError(f"Unknown filter. Available filters: {available_filters}")
+    
+    return img.filter(_FILTERS[filter_type.lower()])
+
+
+def op_filter_tiled(img: Image.Image, filter_type: str, tile: int = 1024,
+                    overlap: int = 8) -> Image.Image:
+    """
+    Apply a named ImageFilter tile by tile into a preallocated output.
+    
+    Each tile is filtered with overlap extra pixels of context on every
+    side, and only its interior is pasted back, so the result matches
+    op_filter as long as overlap covers the filter's kernel radius. Tiles
+    are filtered on a thread pool (Pillow releases the GIL while filtering)
+    with a bounded number of tiles in flight.
+    """
+    if filter_type.lower() not in _FILTERS:
+        available_filters = ', '.join(_FILTERS.keys())
+        raise ValueError(f"Unknown filter. Available filters: {available_filters}")
+    
+    image_filter = _FILTERS[filter_type.lower()]
+    width, height = img.size
+    output = Image.new(img.mode, img.size)
+    img.load()
+    
+    def filter_tile(origin):
+        x, y = origin
+        box = (max(0, x - overlap), max(0, y - overlap),
+               min(width, x + tile + overlap), min(height, y + tile + overlap))
+        filtered = img.crop(box).filter(image_filter)
+        # Keep only the tile's own pixels, dropping the overlap margin
+        inner = (x - box[0], y - box[1],
+                 x - box[0] + min(tile, width - x), y - box[1] + min(tile, height - y))
+        return filtered.crop(inner)
+    
+    origins = ((x, y) for y in range(0, height, tile) for x in range(0, width, tile))
+    max_workers = os.cpu_count() or 1
+    # Keep at most two tiles per worker in flight, so finished tiles cannot
+    # pile up while the main thread is pasting
+    window = 2 * max_workers
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for origin in origins:
+            if len(pending) >= window:
+                done_origin, future = pending.popleft()
+                output.paste(future.result(), done_origin)
+            pending.append((origin, executor.submit(filter_tile, origin)))
+        while pending:
+            done_origin, future = pending.popleft()
+            output.paste(future.result(), done_origin)
+    
+    return output
+
+
+def op_brightness(img: Image.Image, factor: float) -> Image.Image:
+    """Scale img brightness by factor."""
+    return ImageEnhance.Brightness(img).enhance(factor)
+
+
+def op_contrast(img: Image.Image, factor: float) -> Image.Image:
+    """Scale img contrast by factor."""
+    return ImageEnhance.Contrast(img).enhance(factor)
+
+
+def op_color(img: Image.Image, factor: float) -> Image.Image:
+    """Scale img colour saturation by factor."""
+    if img.mode not in ('RGB', 'RGBA'):
+        raise ValueError("Color adjustment requires RGB or RGBA image")
+    return ImageEnhance.Color(img).enhance(factor)
+
+
+def op_tone_curve(img: Image.Image, brightness: float = 1.0, contrast: float = 1.0,
+                  gamma: float = 1.0) -> Image.Image:
+    """Apply gamma, contrast (around mid-grey) and brightness in one LUT pass."""
+    if img.mode not in ('L', 'LA', 'RGB', 'RGBA'):
+        raise ValueError("Tone curve requires L, LA, RGB or RGBA image")
+    
+    # One 256-entry table for the whole chain instead of a full pass per step
+    levels = np.arange(256) / 255.0
+    curve = ((levels ** (1.0 / gamma) - 0.5) * contrast + 0.5) * brightness
+    lut = np.clip(np.rint(curve * 255), 0, 255).astype(np.uint8).tolist()
+    
+    # Alpha bands pass through unchanged
+    identity = list(range(256))
+    table = []
+    for band in img.getbands():
+        table += identity if band == 'A' else lut
+    return img.point(table)
+
+
+def op_grayscale(img: Image.Image) -> Image.Image:
+    """Convert img to 8-bit grayscale."""
+    return img.convert('L')
+
+
+@lru_cache(maxsize=128)
+def _text_bbox(text: str, font: Optional[ImageFont.ImageFont],
+               font_size: int) -> Tuple[int, int, int, int]:
+    """Measure text drawn at the origin, cached per (text, font, size)."""
+    if font is None:
+        # Estimate text size
+        return 0, 0, len(text) * font_size // 2, font_size
+    
+    # Measure on a throwaway 1x1 canvas rather than the destination image
+    return ImageDraw.Draw(Image.new('RGBA', (1, 1))).textbbox((0, 0), text, font=font)
+
+
+def op_watermark(img: Image.Image, text: str, position: str = 'bottom-right',
+                 font_size: int = 36, opacity: int = 128) -> Image.Image:
+    """Composite a semi-transparent white text watermark onto img."""
+    if position not in _WATERMARK_POSITIONS:
+        raise ValueError(f"Invalid position. Available positions: {', '.join(_WATERMARK_POSITIONS.keys())}")
+    
+    # Try to load a font
+    try:
+        font = ImageProcessor._default_font()
+    except:
+        font = None
+    
+    # Get text dimensions (cached across calls with the same text)
+    bbox = _text_bbox(text, font, font_size)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    
+    # Calculate position
+    x, y = _WATERMARK_POSITIONS[position](*img.size, text_width, text_height)
+    
+    # Draw text on a transparent overlay just large enough for its bbox
+    margin = 2
+    overlay = Image.new('RGBA', (text_width + 2 * margin, text_height + 2 * margin),
+                        (255, 255, 255, 0))
+    text_color = (255, 255, 255, opacity)  # White with specified opacity
+    ImageDraw.Draw(overlay).text((margin - bbox[0], margin - bbox[1]), text,
+                                 fill=text_color, font=font)
+    
+    # Work on an RGBA image of our own; the input is left untouched
+    img = img.convert('RGBA') if img.mode != 'RGBA' else img.copy()
+    
+    # Composite only the text region in place; clip overlay parts left/above the image
+    left = x + bbox[0] - margin
+    top = y + bbox[1] - margin
+    img.alpha_composite(overlay, dest=(max(0, left), max(0, top)),
+                        source=(max(0, -left), max(0, -top)))
+    return img
+
+
+def op_thumbnail(img: Image.Image, max_size: Tuple[int, int] = (128, 128)) -> Image.Image:
+    """Return a copy of img shrunk to fit within max_size."""
+    # Resize straight from the source instead of copying it and shrinking in place
+    width, height = img.size
+    scale = min(max_size[0] / width, max_size[1] / height, 1.0)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    if size == img.size:
+        return img.copy()
+    return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
+# Operation names accepted by ImageProcessor.process_batch
+_OPS = {
+    'resize': op_resize,
+    'rotate': op_rotate,
+    'orient': op_transpose_orientation,
+    'flip': op_flip,
+    'crop': op_crop,
+    'filter': op_filter,
+    'filter_tiled': op_filter_tiled,
+    'brightness': op_brightness,
+    'contrast': op_contrast,
+    'color': op_color,
+    'tone_curve': op_tone_curve,
+    'grayscale': op_grayscale,
+    'watermark': op_watermark,
+    'thumbnail': op_thumbnail,
+}
+
+# Modes whose Image.frombuffer images share the buffer instead of copying it
+_POOLABLE_MODES = ('L', 'RGBA', 'RGBX')
+
 
 class ImageProcessor:
     """
@@ -23,6 +413,12 @@ class ImageProcessor:
     loading, manipulating, and saving images using PIL/Pillow.
     """
     
+    # Reusable 8-bit thumbnail pixel buffers keyed by (mode, size)
+    _thumbnail_pool = {}
+    
+    # Pillow's default font, loaded on first use
+    _FONT = None
+    
     def __init__(self, image_path: Optional[str] = None):
         """
         Initialize the ImageProcessor.
@@ -37,6 +433,13 @@ class ImageProcessor:
         if image_path:
             self.load_image(image_path)
     
+    @classmethod
+    def _default_font(cls) -> ImageFont.ImageFont:
+        """Load Pillow's default font once and share it across calls."""
+        if cls._FONT is None:
+            cls._FONT = ImageFont.load_default()
+        return cls._FONT
+    
     def load_image(self, image_path: str) -> bool:
         """
         Load an image from file.
@@ -83,15 +486,10 @@ class ImageProcessor:
         try:
             # Create a gradient background
             if color == 'RGB':
-                img = Image.new('RGB', (width, height), color='white')
-                
-                # Create gradient effect
-                for y in range(height):
-                    for x in range(width):
-                        r = int(255 * x / width)
-                        g = int(255 * y / height)
-                        b = int(255 * (x + y) / (width + height))
-                        img.putpixel((x, y), (r, g, b))
+                # Create gradient effect directly in a single preallocated buffer
+                pixels = np.empty((height, width, 3), dtype=np.uint8)
+                _fill_gradient(pixels, width, height)
+                img = Image.fromarray(pixels, 'RGB')
                         
             elif color == 'L':
                 img = Image.new('L', (width, height), color=128)
@@ -118,7 +516,7 @@ class ImageProcessor:
             
             # Add text
             try:
-                font = ImageFont.load_default()
+                font = self._default_font()
                 draw.text((10, 10), "Sample Image", fill=(0, 0, 0) if color == 'RGB' else 0,
                          font=font)
             except:
@@ -156,10 +554,14 @@ class ImageProcessor:
                 'extrema': self.current_image.getextrema() if self.current_image.mode in ('L', 'RGB') else None
             }
             
-            # Calculate file size estimate
-            img_array = np.array(self.current_image)
-            info['array_shape'] = img_array.shape
-            info['memory_size_kb'] = img_array.nbytes / 1024
+            # Estimate the array shape and size from the mode; converting the
+            # image to an array would copy every pixel just to measure it
+            width, height = self.current_image.size
+            mode = self.current_image.mode
+            bands = Image.getmodebands(mode)
+            itemsize = {'I': 4, 'F': 4}.get(mode, 2 if mode.startswith('I;16') else 1)
+            info['array_shape'] = (height, width) if bands == 1 else (height, width, bands)
+            info['memory_size_kb'] = width * height * bands * itemsize / 1024
             
             return info
             
@@ -185,23 +587,9 @@ class ImageProcessor:
             return False
         
         try:
-            if maintain_aspect:
-                # Calculate aspect ratio preserving dimensions
-                original_width, original_height = self.current_image.size
-                aspect_ratio = original_width / original_height
-                
-                if width / height > aspect_ratio:
-                    # Height is the limiting factor
-                    width = int(height * aspect_ratio)
-                else:
-                    # Width is the limiting factor
-                    height = int(width / aspect_ratio)
-            
-            # Use high-quality resampling
-            self.current_image = self.current_image.resize(
-                (width, height), Image.Resampling.LANCZOS
-            )
+            self.current_image = op_resize(self.current_image, width, height, maintain_aspect)
             
+            width, height = self.current_image.size
             print(f"Image resized to: {width}x{height}")
             return True
             
@@ -225,9 +613,7 @@ class ImageProcessor:
             return False
         
         try:
-            self.current_image = self.current_image.rotate(
-                angle, expand=expand, fillcolor='white'
-            )
+            self.current_image = op_rotate(self.current_image, angle, expand)
             
             print(f"Image rotated by {angle} degrees")
             return True
@@ -236,6 +622,41 @@ class ImageProcessor:
             print(f"Error rotating image: {e}")
             return False
     
+    def transpose_orientation(self, flip_h: bool = False, flip_v: bool = False,
+                              rot: int = 0) -> bool:
+        """
+        Apply a flip and quarter-turn combination as a single transpose.
+        
+        Useful for EXIF orientation normalization: any sequence of flips
+        and 90-degree rotations reduces to one of eight transposes.
+        
+        Args:
+            flip_h: Flip horizontally first
+            flip_v: Flip vertically first
+            rot: Counterclockwise rotation applied after flipping (multiple of 90)
+            
+        Returns:
+            bool: True if transpose successful
+        """
+        if self.current_image is None:
+            print("No image loaded.")
+            return False
+        
+        try:
+            self.current_image = op_transpose_orientation(self.current_image,
+                                                          flip_h, flip_v, rot)
+            
+            print(f"Image reoriented (flip_h={flip_h}, flip_v={flip_v}, rot={rot})")
+            return True
+            
+        except ValueError as e:
+            print(e)
+            return False
+            
+        except Exception as e:
+            print(f"Error reorienting image: {e}")
+            return False
+    
     def flip_image(self, direction: str = 'horizontal') -> bool:
         """
         Flip the image horizontally or vertically.
@@ -251,18 +672,15 @@ class ImageProcessor:
             return False
         
         try:
-            if direction.lower() == 'horizontal':
-                self.current_image = self.current_image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                print("Image flipped horizontally")
-            elif direction.lower() == 'vertical':
-                self.current_image = self.current_image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-                print("Image flipped vertically")
-            else:
-                print("Direction must be 'horizontal' or 'vertical'")
-                return False
+            self.current_image = op_flip(self.current_image, direction)
             
+            print(f"Image flipped {direction.lower()}ly")
             return True
             
+        except ValueError as e:
+            print(e)
+            return False
+            
         except Exception as e:
             print(f"Error flipping image: {e}")
             return False
@@ -285,22 +703,15 @@ class ImageProcessor:
             return False
         
         try:
-            # Validate coordinates
-            width, height = self.current_image.size
-            
-            if left < 0 or top < 0 or right > width or bottom > height:
-                print("Crop coordinates are outside image boundaries")
-                return False
-            
-            if left >= right or top >= bottom:
-                print("Invalid crop coordinates")
-                return False
-            
-            self.current_image = self.current_image.crop((left, top, right, bottom))
+            self.current_image = op_crop(self.current_image, left, top, right, bottom)
             
             print(f"Image cropped to: {right-left}x{bottom-top}")
             return True
             
+        except ValueError as e:
+            print(e)
+            return False
+            
         except Exception as e:
             print(f"Error cropping image: {e}")
             return False
@@ -320,29 +731,51 @@ class ImageProcessor:
             return False
         
         try:
-            filter_map = {
-                'blur': ImageFilter.BLUR,
-                'detail': ImageFilter.DETAIL,
-                'edge_enhance': ImageFilter.EDGE_ENHANCE,
-                'edge_enhance_more': ImageFilter.EDGE_ENHANCE_MORE,
-                'emboss': ImageFilter.EMBOSS,
-                'find_edges': ImageFilter.FIND_EDGES,
-                'sharpen': ImageFilter.SHARPEN,
-                'smooth': ImageFilter.SMOOTH,
-                'smooth_more': ImageFilter.SMOOTH_MORE,
-                'contour': ImageFilter.CONTOUR
-            }
+            self.current_image = op_filter(self.current_image, filter_type)
             
-            if filter_type.lower() not in filter_map:
-                available_filters = ', '.join(filter_map.keys())
-                print(f"Unknown filter. Available filters: {available_filters}")
-                return False
+            print(f"Applied {filter_type} filter")
+            return True
             
-            self.current_image = self.current_image.filter(filter_map[filter_type.lower()])
+        except ValueError as e:
+            print(e)
+            return False
             
-            print(f"Applied {filter_type} filter")
+        except Exception as e:
+            print(f"Error applying filter: {e}")
+            return False
+    
+    def apply_filter_tiled(self, filter_type: str, tile: int = 1024,
+                           overlap: int = 8) -> bool:
+        """
+        Apply a filter to a very large image one tile at a time.
+        
+        Besides the loaded image and the output, only a bounded number of
+        tile-sized intermediates exist at once, so the extra working memory
+        does not grow with the image size.
+        
+        Args:
+            filter_type: Type of filter to apply
+            tile: Tile edge length in pixels
+            overlap: Context pixels added around each tile (>= kernel radius)
+            
+        Returns:
+            bool: True if filter applied successfully
+        """
+        if self.current_image is None:
+            print("No image loaded.")
+            return False
+        
+        try:
+            self.current_image = op_filter_tiled(self.current_image, filter_type,
+                                                 tile, overlap)
+            
+            print(f"Applied {filter_type} filter in {tile}x{tile} tiles")
             return True
             
+        except ValueError as e:
+            print(e)
+            return False
+            
         except Exception as e:
             print(f"Error applying filter: {e}")
             return False
@@ -362,8 +795,7 @@ class ImageProcessor:
             return False
         
         try:
-            enhancer = ImageEnhance.Brightness(self.current_image)
-            self.current_image = enhancer.enhance(factor)
+            self.current_image = op_brightness(self.current_image, factor)
             
             print(f"Brightness adjusted by factor {factor}")
             return True
@@ -387,8 +819,7 @@ class ImageProcessor:
             return False
         
         try:
-            enhancer = ImageEnhance.Contrast(self.current_image)
-            self.current_image = enhancer.enhance(factor)
+            self.current_image = op_contrast(self.current_image, factor)
             
             print(f"Contrast adjusted by factor {factor}")
             return True
@@ -412,20 +843,57 @@ class ImageProcessor:
             return False
         
         try:
-            if self.current_image.mode not in ('RGB', 'RGBA'):
-                print("Color adjustment requires RGB or RGBA image")
-                return False
-            
-            enhancer = ImageEnhance.Color(self.current_image)
-            self.current_image = enhancer.enhance(factor)
+            self.current_image = op_color(self.current_image, factor)
             
             print(f"Color saturation adjusted by factor {factor}")
             return True
             
+        except ValueError as e:
+            print(e)
+            return False
+            
         except Exception as e:
             print(f"Error adjusting color: {e}")
             return False
     
+    def apply_tone_curve(self, brightness: float = 1.0, contrast: float = 1.0,
+                         gamma: float = 1.0) -> bool:
+        """
+        Adjust gamma, contrast and brightness together in a single pass.
+        
+        The three adjustments are folded into one lookup table, so chaining
+        them touches the pixels once instead of once per adjustment. Contrast
+        pivots around mid-grey rather than the image mean used by
+        adjust_contrast.
+        
+        Args:
+            brightness: Brightness factor (1.0 = no change)
+            contrast: Contrast factor around mid-grey (1.0 = no change)
+            gamma: Gamma correction (1.0 = no change, >1.0 = lighter midtones)
+            
+        Returns:
+            bool: True if adjustment successful
+        """
+        if self.current_image is None:
+            print("No image loaded.")
+            return False
+        
+        try:
+            self.current_image = op_tone_curve(self.current_image, brightness,
+                                               contrast, gamma)
+            
+            print(f"Tone curve applied (brightness={brightness}, "
+                  f"contrast={contrast}, gamma={gamma})")
+            return True
+            
+        except ValueError as e:
+            print(e)
+            return False
+            
+        except Exception as e:
+            print(f"Error applying tone curve: {e}")
+            return False
+    
     def convert_to_grayscale(self) -> bool:
         """
         Convert image to grayscale.
@@ -438,7 +906,7 @@ class ImageProcessor:
             return False
         
         try:
-            self.current_image = self.current_image.convert('L')
+            self.current_image = op_grayscale(self.current_image)
             
             print("Image converted to grayscale")
             return True
@@ -466,69 +934,62 @@ class ImageProcessor:
             return False
         
         try:
-            # Create a transparent overlay
-            overlay = Image.new('RGBA', self.current_image.size, (255, 255, 255, 0))
-            draw = ImageDraw.Draw(overlay)
-            
-            # Try to load a font
-            try:
-                font = ImageFont.load_default()
-            except:
-                font = None
-            
-            # Get text dimensions
-            if font:
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-            else:
-                # Estimate text size
-                text_width = len(text) * font_size // 2
-                text_height = font_size
-            
-            # Calculate position
-            img_width, img_height = self.current_image.size
-            
-            position_map = {
-                'top-left': (10, 10),
-                'top-right': (img_width - text_width - 10, 10),
-                'bottom-left': (10, img_height - text_height - 10),
-                'bottom-right': (img_width - text_width - 10, img_height - text_height - 10),
-                'center': (img_width // 2 - text_width // 2, img_height // 2 - text_height // 2)
-            }
-            
-            if position not in position_map:
-                print(f"Invalid position. Available positions: {', '.join(position_map.keys())}")
-                return False
-            
-            x, y = position_map[position]
-            
-            # Draw text on overlay
-            text_color = (255, 255, 255, opacity)  # White with specified opacity
-            draw.text((x, y), text, fill=text_color, font=font)
-            
-            # Convert current image to RGBA if needed
-            if self.current_image.mode != 'RGBA':
-                rgba_image = self.current_image.convert('RGBA')
-            else:
-                rgba_image = self.current_image
-            
-            # Composite the overlay onto the image
-            self.current_image = Image.alpha_composite(rgba_image, overlay)
+            self.current_image = op_watermark(self.current_image, text, position,
+                                              font_size, opacity)
             
             print(f"Added watermark '{text}' at {position}")
             return True
             
+        except ValueError as e:
+            print(e)
+            return False
+            
         except Exception as e:
             print(f"Error adding watermark: {e}")
             return False
     
-    def create_thumbnail(self, max_size: Tuple[int, int] = (128, 128)) -> Optional[Image.Image]:
+    @classmethod
+    def _pool_buffer(cls, mode: str, size: Tuple[int, int]) -> np.ndarray:
+        """Take a thumbnail buffer for (mode, size) from the pool, or allocate one."""
+        buffers = cls._thumbnail_pool.get((mode, size))
+        if buffers:
+            return buffers.pop()
+        
+        width, height = size
+        bands = Image.getmodebands(mode)
+        shape = (height, width) if bands == 1 else (height, width, bands)
+        return np.empty(shape, dtype=np.uint8)
+    
+    @classmethod
+    def release_thumbnail(cls, thumbnail: Image.Image):
+        """
+        Return a pooled thumbnail's buffer so the next thumbnail can reuse it.
+        
+        The thumbnail must not be used after it has been released.
+        
+        Args:
+            thumbnail: Image returned by create_thumbnail(pooled=True)
+        """
+        buffer = getattr(thumbnail, '_pool_buffer', None)
+        if buffer is not None:
+            del thumbnail._pool_buffer
+            cls._thumbnail_pool.setdefault((thumbnail.mode, thumbnail.size), []).append(buffer)
+    
+    def create_thumbnail(self, max_size: Tuple[int, int] = (128, 128),
+                         pooled: bool = False) -> Optional[Image.Image]:
         """
         Create a thumbnail of the current image.
         
+        With pooled=True the thumbnail's pixels live in a buffer shared
+        through a class-level pool. Hand it back with release_thumbnail()
+        once it has been saved, and batch thumbnailing will then recycle
+        the same few buffers instead of allocating one per image. Pooling
+        applies to L, RGBA and RGBX thumbnails only; other modes (such as
+        RGB) are returned as ordinary images.
+        
         Args:
             max_size: Maximum size as (width, height) tuple
+            pooled: Whether to back the thumbnail with a pooled buffer
             
         Returns:
             PIL.Image: Thumbnail image
@@ -538,8 +999,17 @@ class ImageProcessor:
             return None
         
         try:
-            thumbnail = self.current_image.copy()
-            thumbnail.thumbnail(max_size, Image.Resampling.LANCZOS)
+            thumbnail = op_thumbnail(self.current_image, max_size)
+            
+            # Image.frombuffer only aliases memory for Pillow's mapped modes;
+            # for others (RGB included) it copies, so pooling would gain nothing
+            if pooled and thumbnail.mode in _POOLABLE_MODES:
+                # Copy into a pooled buffer; the wrapping image shares its memory
+                buffer = self._pool_buffer(thumbnail.mode, thumbnail.size)
+                np.copyto(buffer, np.asarray(thumbnail))
+                thumbnail = Image.frombuffer(thumbnail.mode, thumbnail.size, buffer,
+                                             'raw', thumbnail.mode, 0, 1)
+                thumbnail._pool_buffer = buffer
             
             print(f"Created thumbnail: {thumbnail.size}")
             return thumbnail
@@ -549,14 +1019,19 @@ class ImageProcessor:
             return None
     
     def save_image(self, output_path: str, quality: int = 95,
-                  optimize: bool = True) -> bool:
+                  optimize: bool = True, compress_level: int = 1) -> bool:
         """
         Save the current image to file.
         
+        PNG files are written with compress_level alone: Pillow's optimize
+        flag forces the slowest zlib setting, which costs far more time than
+        it saves in bytes. Raise compress_level (up to 9) for smaller files.
+        
         Args:
             output_path: Path to save the image
-            quality: JPEG quality (1-100)
-            optimize: Whether to optimize the image
+            quality: JPEG/WebP quality (1-100)
+            optimize: Whether to optimize the image (not used for PNG)
+            compress_level: PNG zlib level (0-9, 1 = fastest)
             
         Returns:
             bool: True if save successful
@@ -570,16 +1045,19 @@ class ImageProcessor:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             
             # Determine save parameters based on file format
-            save_kwargs = {'optimize': optimize}
-            
             file_ext = Path(output_path).suffix.lower()
+            format_kwargs = {
+                '.png': {'compress_level': compress_level},
+                '.jpg': {'quality': quality, 'optimize': optimize, 'progressive': True},
+                '.jpeg': {'quality': quality, 'optimize': optimize, 'progressive': True},
+                '.webp': {'quality': quality, 'method': 4},
+            }
+            save_kwargs = format_kwargs.get(file_ext, {'optimize': optimize})
+            
             if file_ext in ['.jpg', '.jpeg']:
-                save_kwargs['quality'] = quality
                 # Convert RGBA to RGB for JPEG
                 if self.current_image.mode == 'RGBA':
-                    rgb_image = Image.new('RGB', self.current_image.size, (255, 255, 255))
-                    rgb_image.paste(self.current_image, mask=self.current_image.split()[-1])
-                    rgb_image.save(output_path, **save_kwargs)
+                    _flatten_alpha(self.current_image).save(output_path, **save_kwargs)
                 else:
                     self.current_image.save(output_path, **save_kwargs)
             else:
@@ -604,7 +1082,8 @@ class ImageProcessor:
             return False
         
         try:
-            self.current_image = self.original_image.copy()
+            # Share the original; operations return new images, so no copy is needed
+            self.current_image = self.original_image
             print("Image reset to original")
             return True
             
@@ -616,6 +1095,9 @@ class ImageProcessor:
         """
         Get statistical information about the image.
         
+        The statistics are computed on a read-only view of the image
+        buffer, so the pixel data must not be mutated while they run.
+        
         Returns:
             dict: Dictionary containing image statistics
         """
@@ -624,16 +1106,45 @@ class ImageProcessor:
             return {}
         
         try:
-            # Convert to numpy array for analysis
-            img_array = np.array(self.current_image)
+            # Wrap the image buffer as a read-only, C-contiguous numpy array once,
+            # so every reshape and view below is free
+            img_array = np.ascontiguousarray(np.asarray(self.current_image))
+            img_array.flags.writeable = False
+            flat = img_array.ravel()
+            
+            # Min, max, sum and sum of squares of 8-bit data in a single traversal
+            if flat.dtype == np.uint8:
+                mn, mx, total, sumsq = _img_stats(flat)
+                mean = total / flat.size
+                std = math.sqrt(max(sumsq / flat.size - mean * mean, 0.0))
+            else:
+                mn, mx = flat.min(), flat.max()
+                mean, std = flat.mean(), flat.std()
+            
+            # Pack each pixel into one uint32 key so unique works on a 1-D array
+            if img_array.ndim == 3:
+                pixels = flat.reshape(-1, img_array.shape[-1])
+                if img_array.dtype == np.uint8 and img_array.shape[-1] == 4:
+                    # RGBA bytes already form a uint32: reinterpret without copying
+                    keys = flat.view(np.uint32)
+                elif img_array.shape[-1] == 3:
+                    keys = ((pixels[:, 0].astype(np.uint32) << 16)
+                            | (pixels[:, 1].astype(np.uint32) << 8)
+                            | pixels[:, 2])
+                else:
+                    keys = None
+                unique_colors = len(np.unique(keys) if keys is not None
+                                    else np.unique(pixels, axis=0))
+            else:
+                unique_colors = len(np.unique(flat))
             
             stats = {
                 'shape': img_array.shape,
-                'min_value': int(np.min(img_array)),
-                'max_value': int(np.max(img_array)),
-                'mean_value': float(np.mean(img_array)),
-                'std_value': float(np.std(img_array)),
-                'unique_colors': len(np.unique(img_array.reshape(-1, img_array.shape[-1]), axis=0)) if len(img_array.shape) == 3 else len(np.unique(img_array))
+                'min_value': int(mn),
+                'max_value': int(mx),
+                'mean_value': float(mean),
+                'std_value': float(std),
+                'unique_colors': unique_colors
             }
             
             return stats
@@ -641,6 +1152,114 @@ class ImageProcessor:
         except Exception as e:
             print(f"Error calculating statistics: {e}")
             return {}
+    
+    def process_batch(self, jobs: List[Tuple[Optional[str], tuple, str]],
+                      output_dir: Union[str, Path]) -> List[bool]:
+        """
+        Apply independent operations to the current image in parallel.
+        
+        Every job starts from the current image, runs one pure operation
+        from _OPS and saves the result. Jobs run on a thread pool because
+        Pillow releases the GIL while filtering, resampling and encoding.
+        
+        Args:
+            jobs: List of (op_name, args, filename) tuples; an op_name of
+                  None saves the image unchanged
+            output_dir: Directory the results are written to
+            
+        Returns:
+            List[bool]: Save result for each job, in order
+        """
+        if self.current_image is None:
+            print("No image loaded.")
+            return []
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Decode once up front so worker threads only ever read the pixels
+        image = self.current_image
+        image.load()
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(
+                lambda job: _run_job(image, job[0], job[1], str(output_dir / job[2])),
+                jobs
+            ))
+
+
+    @staticmethod
+    def process_directory(input_dir: Union[str, Path], output_dir: Union[str, Path],
+                          operations: List[Tuple[str, tuple]]) -> List[bool]:
+        """
+        Apply the same operations to every image in a directory in parallel.
+        
+        Each file is handled by a worker process with its own
+        ImageProcessor, so independent images scale across all cores.
+        
+        Args:
+            input_dir: Directory containing the source images
+            output_dir: Directory the processed images are written to
+            operations: List of (method_name, args) tuples, e.g.
+                        [('resize_image', (800, 600)), ('apply_filter', ('sharpen',))];
+                        everything must be picklable
+            
+        Returns:
+            List[bool]: Save result for each image, in sorted file order
+        """
+        input_paths = sorted(
+            path for path in Path(input_dir).iterdir()
+            if path.suffix.lower() in _IMAGE_EXTENSIONS
+        )
+        if not input_paths:
+            print(f"No images found in '{input_dir}'")
+            return []
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_paths = [str(output_dir / path.name) for path in input_paths]
+        
+        # A few chunks per worker keeps the pool balanced without per-file IPC
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(input_paths) // (4 * workers))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _process_file, map(str, input_paths), output_paths,
+                repeat(operations), chunksize=chunksize
+            ))
+
+
+# File extensions picked up by ImageProcessor.process_directory
+_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff', '.webp'}
+
+
+def _process_file(input_path: str, output_path: str,
+                  operations: List[Tuple[str, tuple]]) -> bool:
+    """Load one image in a worker process, apply operations and save it."""
+    processor = ImageProcessor(input_path)
+    if processor.current_image is None:
+        return False
+    
+    for method_name, args in operations:
+        if not getattr(processor, method_name)(*args):
+            return False
+    
+    return processor.save_image(output_path)
+
+
+def _run_job(image: Image.Image, op_name: Optional[str], args: tuple,
+             output_path: str) -> bool:
+    """Apply one _OPS operation to image and save the result."""
+    try:
+        result = _OPS[op_name](image, *args) if op_name is not None else image
+    except Exception as e:
+        print(f"Error applying {op_name}: {e}")
+        return False
+    
+    processor = ImageProcessor()
+    processor.current_image = result
+    return processor.save_image(output_path)
 
 
 def main():
@@ -663,6 +1282,10 @@ def main():
     print("Image Processor - Demonstration")
     print("=" * 40)
     
+    if not PILLOW_SIMD:
+        print(f"Note: running on stock Pillow {PIL.__version__}; "
+              "pillow-simd speeds up resize, filters and compositing.")
+    
     try:
         # Check if image path provided as command line argument
         if len(sys.argv) > 1:
@@ -702,56 +1325,23 @@ def main():
         print("\n3. APPLYING TRANSFORMATIONS")
         print("-" * 30)
         
-        # Save original
-        processor.save_image(str(output_dir / "01_original.png"))
-        
-        # Resize
-        processor.resize_image(400, 300, maintain_aspect=True)
-        processor.save_image(str(output_dir / "02_resized.png"))
-        
-        # Reset and apply filter
-        processor.reset_to_original()
-        processor.apply_filter('blur')
-        processor.save_image(str(output_dir / "03_blur_filter.png"))
-        
-        # Reset and adjust brightness
-        processor.reset_to_original()
-        processor.adjust_brightness(1.5)
-        processor.save_image(str(output_dir / "04_brightness.png"))
-        
-        # Reset and adjust contrast
-        processor.reset_to_original()
-        processor.adjust_contrast(1.5)
-        processor.save_image(str(output_dir / "05_contrast.png"))
-        
-        # Reset and convert to grayscale
-        processor.reset_to_original()
-        processor.convert_to_grayscale()
-        processor.save_image(str(output_dir / "06_grayscale.png"))
-        
-        # Reset and add watermark
-        processor.reset_to_original()
-        processor.add_text_watermark("SAMPLE", position='bottom-right')
-        processor.save_image(str(output_dir / "07_watermark.png"))
-        
-        # Reset and rotate
-        processor.reset_to_original()
-        processor.rotate_image(45)
-        processor.save_image(str(output_dir / "08_rotated.png"))
-        
-        # Reset and crop (center portion)
-        processor.reset_to_original()
+        # Every transformation starts from the same image, so run them as a batch
         width, height = processor.current_image.size
         crop_margin = min(width, height) // 4
-        processor.crop_image(crop_margin, crop_margin, 
-                           width - crop_margin, height - crop_margin)
-        processor.save_image(str(output_dir / "09_cropped.png"))
-        
-        # Create thumbnail
-        processor.reset_to_original()
-        thumbnail = processor.create_thumbnail((150, 150))
-        if thumbnail:
-            thumbnail.save(str(output_dir / "10_thumbnail.png"))
+        jobs = [
+            (None, (), "01_original.png"),
+            ('resize', (400, 300, True), "02_resized.png"),
+            ('filter', ('blur',), "03_blur_filter.png"),
+            ('brightness', (1.5,), "04_brightness.png"),
+            ('contrast', (1.5,), "05_contrast.png"),
+            ('grayscale', (), "06_grayscale.png"),
+            ('watermark', ("SAMPLE", 'bottom-right'), "07_watermark.png"),
+            ('rotate', (45,), "08_rotated.png"),
+            ('crop', (crop_margin, crop_margin,
+                      width - crop_margin, height - crop_margin), "09_cropped.png"),
+            ('thumbnail', ((150, 150),), "10_thumbnail.png"),
+        ]
+        processor.process_batch(jobs, output_dir)
         
         print(f"\nProcessing complete!")
         print(f"Check the '{output_dir}' directory for all processed images.")
@@ -1,3 +1,5 @@
+import io
+
 import qrcode
 from fpdf import FPDF
 
@@ -13,8 +15,10 @@ qr.make(fit=True)
 
 img = qr.make_image(fill='black', back_color='white')
 
-# Save QR code as an image
-img.save('qrcode.png')
+# Encode the QR code as PNG in memory; no intermediate qrcode.png on disk
+png_buffer = io.BytesIO()
+img.save(png_buffer, format='PNG')
+png_buffer.seek(0)
 
 # Create PDF and add QR code image
 pdf = FPDF()
@@ -24,5 +28,5 @@ pdf.cell(40, 10, 'QR Code Example')
 pdf.ln(10)
 pdf.set_font('Arial', '', 12)
 pdf.cell(40, 10, 'QR code for https://www.junia.com')   
-pdf.image('qrcode.png', x=10, y=80, w=100)
+pdf.image(png_buffer, x=10, y=80, w=100)
 pdf.output('qrcode.pdf', 'F')
\ No newline at end of file
@@ -6,17 +6,203 @@ This script demonstrates various text analysis techniques including word countin
 frequency analysis, sentiment analysis, and text statistics.
 
 Author: Python Learning Series
-Dependencies: collections, re, string
+Dependencies: collections, re, string, numpy (optional), numba (optional)
 """
 
+import codecs
+import heapq
+import io
+import mmap
 import re
 import string
 from collections import Counter, defaultdict
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 import sys
 import unicodedata
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Common English stop words
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'i', 'me', 'my', 'we', 'our', 'you',
+    'your', 'this', 'these', 'they', 'them', 'their', 'have', 'had',
+    'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'must', 'can', 'shall', 'am', 'been', 'being', 'or',
+    'but', 'not', 'no', 'nor', 'so', 'if', 'then', 'than', 'when',
+    'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few',
+    'more', 'most', 'other', 'some', 'such', 'only', 'own', 'same',
+    'up', 'out', 'over', 'under', 'again', 'further', 'once', 'here',
+    'there', 'during', 'before', 'after', 'above', 'below', 'between'
+})
+
+# Simple positive and negative word lists for analyze_sentiment
+_POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+    'awesome', 'brilliant', 'outstanding', 'perfect', 'beautiful',
+    'happy', 'joy', 'love', 'like', 'best', 'better', 'success',
+    'successful', 'win', 'winning', 'positive', 'optimistic',
+    'pleased', 'delighted', 'thrilled', 'excited', 'cheerful'
+})
+
+_NEGATIVE_WORDS = frozenset({
+    'bad', 'terrible', 'awful', 'horrible', 'disgusting', 'hate',
+    'dislike', 'worst', 'worse', 'fail', 'failure', 'negative',
+    'pessimistic', 'sad', 'angry', 'mad', 'disappointed', 'upset',
+    'frustrated', 'annoying', 'irritating', 'boring', 'stupid',
+    'ridiculous', 'pathetic', 'useless', 'worthless', 'disaster'
+})
+
+# Patterns used on every load, compiled once at import
+_WS_RE = re.compile(r'\s+')
+_SENT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r"\b[a-zA-Z']+\b")
+
+# str.translate table deleting ASCII whitespace
+_WS_DELETE = str.maketrans('', '', string.whitespace)
+
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a user-supplied pattern, reusing earlier compilations."""
+    return re.compile(pattern, flags)
+
+
+def _whitespace_cut(text: str) -> int:
+    """
+    Index where the last run of whitespace in text starts (0 if none).
+    
+    Cutting there keeps the last word and the whitespace before it together
+    in the remainder, so no token or newline run is split.
+    """
+    i = len(text) - 1
+    while i >= 0 and not text[i].isspace():
+        i -= 1
+    while i > 0 and text[i - 1].isspace():
+        i -= 1
+    return max(i, 0)
+
+
+def _count_syllables_word(word: str) -> int:
+    """Approximate the syllables in one lowercase word by counting vowel runs."""
+    vowels = 'aeiouy'
+    syllable_count = 0
+    prev_was_vowel = False
+    
+    for char in word:
+        if char in vowels:
+            if not prev_was_vowel:
+                syllable_count += 1
+            prev_was_vowel = True
+        else:
+            prev_was_vowel = False
+    
+    # Handle silent 'e' at the end
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+    
+    return max(1, syllable_count)
+
+
+def _count_syllables_python(words: List[str]) -> int:
+    """Total syllables over a list of lowercase words (pure Python)."""
+    return sum(_count_syllables_word(word) for word in words)
+
+
+def _count_syllables_numpy(words: List[str]) -> int:
+    """
+    Same as _count_syllables_python with the character loop in NumPy.
+    
+    The words are joined into one ASCII byte buffer with a space between
+    them, a vowel run starts wherever a vowel follows a non-vowel, and the
+    run starts are summed per word with np.add.reduceat.
+    """
+    if not words:
+        return 0
+    
+    chars = np.frombuffer(' '.join(words).encode('ascii', errors='replace'), dtype=np.uint8)
+    is_vowel = _VOWEL_TABLE[chars]
+    run_starts = is_vowel.copy()
+    run_starts[1:] &= ~is_vowel[:-1]
+    
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    offsets = np.zeros(len(words), dtype=np.int64)
+    np.cumsum(lengths[:-1] + 1, out=offsets[1:])
+    counts = np.add.reduceat(run_starts, offsets, dtype=np.int64)
+    
+    # Handle silent 'e' at the end
+    silent_e = (chars[offsets + lengths - 1] == ord('e')) & (counts > 1)
+    counts -= silent_e
+    
+    return int(np.maximum(counts, 1).sum())
+
+
+def _word_spans_loop(buf, is_word, is_token, starts, ends):
+    """
+    Mark where _WORD_RE matches start and end in an ASCII byte buffer.
+    
+    Reproduces re.findall(r"\\b[a-zA-Z']+\\b") exactly: at each word
+    boundary that begins a run of letters/apostrophes, take the longest
+    prefix of the run that also ends on a boundary, then resume after it.
+    
+    Args:
+        buf: Text as uint8 bytes (ASCII only)
+        is_word: 256-entry table of \\w bytes ([A-Za-z0-9_])
+        is_token: 256-entry table of letters and apostrophe
+        starts: Zeroed bool array of len(buf) + 1, set at match starts
+        ends: Zeroed bool array of len(buf) + 1, set at match ends
+    """
+    n = buf.shape[0]
+    i = 0
+    while i < n:
+        c = buf[i]
+        left_is_word = is_word[buf[i - 1]] if i > 0 else False
+        if is_token[c] and left_is_word != is_word[c]:
+            run_end = i
+            while run_end < n and is_token[buf[run_end]]:
+                run_end += 1
+            # Back off from the end of the run until it sits on a boundary
+            end = run_end
+            while end > i:
+                right_is_word = is_word[buf[end]] if end < n else False
+                if is_word[buf[end - 1]] != right_is_word:
+                    break
+                end -= 1
+            if end > i:
+                starts[i] = True
+                ends[end] = True
+                i = end
+                continue
+        i += 1
+
+
+if np is not None:
+    _VOWEL_TABLE = np.zeros(256, dtype=bool)
+    _VOWEL_TABLE[np.frombuffer(b'aeiouy', dtype=np.uint8)] = True
+    _count_syllables = _count_syllables_numpy
+    
+    _BYTE_CHARS = [chr(i) for i in range(256)]
+    _IS_WORD = np.array([c.isascii() and (c.isalnum() or c == '_') for c in _BYTE_CHARS])
+    _IS_TOKEN = np.array([c.isascii() and (c.isalpha() or c == "'") for c in _BYTE_CHARS])
+else:
+    _count_syllables = _count_syllables_python
+
+# Compile the tokenizer when Numba is installed; otherwise _WORD_RE is used
+_word_spans = (njit(cache=True)(_word_spans_loop)
+               if njit is not None and np is not None else None)
+
 
 class TextAnalyzer:
     """
@@ -34,34 +220,24 @@ class TextAnalyzer:
         self.original_text = text if text else ""
         self.processed_text = ""
         self.sentences = []
-        self.words = []
+        self._set_words([])
+        self._char_count = 0
+        self._char_count_no_spaces = 0
+        self._paragraph_count = 0
+        self._last_text = None
         self.stop_words = self._load_stop_words()
         
         if text:
             self.load_text(text)
     
-    def _load_stop_words(self) -> set:
+    def _load_stop_words(self) -> frozenset:
         """
         Load common English stop words.
         
         Returns:
-            set: Set of stop words
-        """
-        # Common English stop words
-        stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'i', 'me', 'my', 'we', 'our', 'you',
-            'your', 'this', 'these', 'they', 'them', 'their', 'have', 'had',
-            'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
-            'might', 'must', 'can', 'shall', 'am', 'been', 'being', 'or',
-            'but', 'not', 'no', 'nor', 'so', 'if', 'then', 'than', 'when',
-            'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few',
-            'more', 'most', 'other', 'some', 'such', 'only', 'own', 'same',
-            'up', 'out', 'over', 'under', 'again', 'further', 'once', 'here',
-            'there', 'during', 'before', 'after', 'above', 'below', 'between'
-        }
-        return stop_words
+            frozenset: Shared, immutable set of stop words
+        """
+        return _STOP_WORDS
     
     def load_text(self, text: str) -> bool:
         """
@@ -74,10 +250,21 @@ class TextAnalyzer:
             bool: True if text loaded successfully
         """
         try:
+            # Re-loading the same text would rebuild identical results
+            if text == self._last_text:
+                print("Text unchanged; reusing previous analysis")
+                return True
+            
             self.original_text = text
+            self._char_count = len(text)
+            self._char_count_no_spaces = len(text.translate(_WS_DELETE))
+            self._paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
             self.processed_text = self._preprocess_text(text)
+            # Split the raw text: NFKD would turn characters such as '…' and
+            # fullwidth '！' into extra ASCII sentence terminators
             self.sentences = self._split_sentences(text)
-            self.words = self._extract_words(self.processed_text)
+            self._set_words(self._extract_words(self.processed_text))
+            self._last_text = text
             
             print(f"Text loaded successfully")
             print(f"Characters: {len(self.original_text)}")
@@ -116,6 +303,111 @@ class TextAnalyzer:
             print(f"Error loading file: {e}")
             return False
     
+    def load_words_from_file(self, file_path: str, encoding: str = 'utf-8',
+                             chunk_size: int = 4 * 1024 * 1024) -> bool:
+        """
+        Stream words and sentences from a large file without reading it whole.
+        
+        The file is memory-mapped and decoded chunk by chunk. Each chunk is
+        cut after its last sentence terminator, or before its last run of
+        whitespace when it has none, and the remainder is carried into the
+        next one, so no word straddles two chunks; a sentence cut at
+        whitespace is joined back together. Only the tokens and counts are
+        kept: basic statistics, word frequency, word lengths, readability,
+        sentiment and export_analysis work afterwards, while character
+        frequency and pattern search need the full text from load_from_file.
+        
+        Args:
+            file_path: Path to the text file
+            encoding: File encoding
+            chunk_size: Bytes decoded per step
+            
+        Returns:
+            bool: True if file loaded successfully
+        """
+        try:
+            if not Path(file_path).exists():
+                print(f"Error: File '{file_path}' not found.")
+                return False
+            
+            if Path(file_path).stat().st_size == 0:
+                # mmap cannot map an empty file
+                return self.load_text("")
+            
+            decoder = codecs.getincrementaldecoder(encoding)()
+            sentences = []
+            words = []
+            char_count = 0
+            char_count_no_spaces = 0
+            paragraph_count = 0
+            # Pieces of a sentence spanning whitespace cuts, and whether the
+            # previous chunk ended inside a paragraph
+            open_sentence = []
+            open_paragraph = False
+            carry = ""
+            
+            with open(file_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, len(mapped), chunk_size):
+                    final = offset + chunk_size >= len(mapped)
+                    text = carry + decoder.decode(mapped[offset:offset + chunk_size], final)
+                    
+                    cut_in_sentence = False
+                    if not final:
+                        cut = max(text.rfind('.'), text.rfind('!'), text.rfind('?')) + 1
+                        if not cut:
+                            # No sentence end: cut before the last whitespace run
+                            cut = _whitespace_cut(text)
+                            cut_in_sentence = True
+                        text, carry = text[:cut], text[cut:]
+                    
+                    char_count += len(text)
+                    char_count_no_spaces += len(text.translate(_WS_DELETE))
+                    
+                    # Newline runs never straddle a cut, so only the paragraph
+                    # spanning the cut can be counted twice
+                    paragraphs = [bool(p.strip()) for p in text.split('\n\n')]
+                    paragraph_count += sum(paragraphs)
+                    if open_paragraph and paragraphs[0]:
+                        paragraph_count -= 1
+                    if len(paragraphs) > 1 or paragraphs[0]:
+                        open_paragraph = paragraphs[-1]
+                    
+                    words.extend(self._extract_words(self._preprocess_text(text)))
+                    if cut_in_sentence:
+                        # The whole chunk lies inside one sentence; join it later
+                        open_sentence.append(text)
+                        continue
+                    
+                    # Sentences come from the raw text, as in load_text
+                    pieces = _SENT_RE.split(text)
+                    if open_sentence:
+                        # Close the sentence left open by earlier chunks
+                        open_sentence.append(pieces[0])
+                        pieces[0] = ''.join(open_sentence)
+                        open_sentence = []
+                    sentences.extend(piece.strip() for piece in pieces if piece.strip())
+            
+            self.original_text = ""
+            self.processed_text = ""
+            self._last_text = None
+            self.sentences = sentences
+            self._char_count = char_count
+            self._char_count_no_spaces = char_count_no_spaces
+            self._paragraph_count = paragraph_count
+            self._set_words(words)
+            
+            print(f"Streamed words from '{file_path}'")
+            print(f"Characters: {char_count}")
+            print(f"Words: {len(self.words)}")
+            print(f"Sentences: {len(self.sentences)}")
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error streaming file: {e}")
+            return False
+    
     def _preprocess_text(self, text: str, remove_punctuation: bool = False,
                         to_lowercase: bool = True) -> str:
         """
@@ -130,15 +422,16 @@ class TextAnalyzer:
             str: Preprocessed text
         """
         try:
-            # Normalize unicode characters
-            text = unicodedata.normalize('NFKD', text)
+            # Normalize unicode characters (pure ASCII is already normalized)
+            if not text.isascii():
+                text = unicodedata.normalize('NFKD', text)
             
-            # Convert to lowercase if requested
-            if to_lowercase:
+            # Convert to lowercase if requested (skip the copy if already lowercase)
+            if to_lowercase and not text.islower():
                 text = text.lower()
             
             # Remove extra whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _WS_RE.sub(' ', text).strip()
             
             # Remove punctuation if requested
             if remove_punctuation:
@@ -162,7 +455,7 @@ class TextAnalyzer:
         """
         try:
             # Simple sentence splitting using regex
-            sentences = re.split(r'[.!?]+', text)
+            sentences = _SENT_RE.split(text)
             
             # Clean up sentences
             sentences = [s.strip() for s in sentences if s.strip()]
@@ -178,14 +471,23 @@ class TextAnalyzer:
         Extract words from text.
         
         Args:
-            text: Input text
+            text: Input text, already lowercased by _preprocess_text
             
         Returns:
             List[str]: List of words
         """
         try:
-            # Extract words using regex (alphanumeric characters and apostrophes)
-            words = re.findall(r"\b[a-zA-Z']+\b", text.lower())
+            # Extract words (letters and apostrophes between word boundaries)
+            if _word_spans is not None and text.isascii():
+                # Scan the bytes against lookup tables and slice the matches out
+                buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+                starts = np.zeros(len(buf) + 1, dtype=bool)
+                ends = np.zeros(len(buf) + 1, dtype=bool)
+                _word_spans(buf, _IS_WORD, _IS_TOKEN, starts, ends)
+                words = [text[start:end] for start, end in
+                         zip(np.flatnonzero(starts).tolist(), np.flatnonzero(ends).tolist())]
+            else:
+                words = _WORD_RE.findall(text)
             
             # Remove single character words (except 'a' and 'i')
             words = [word for word in words if len(word) > 1 or word in ['a', 'i']]
@@ -196,6 +498,124 @@ class TextAnalyzer:
             print(f"Error extracting words: {e}")
             return []
     
+    def _set_words(self, words: List[str]):
+        """
+        Store the extracted words and everything derived from them.
+        
+        Word counts, the unique-word set and word lengths are built once here;
+        frequency, statistics, readability and sentiment all reuse them.
+        
+        Args:
+            words: Words extracted from the loaded text
+        """
+        self.words = words
+        self._word_counter = Counter(words)
+        self._word_set = set(self._word_counter)
+        if np is not None:
+            self._word_lens = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+        else:
+            self._word_lens = list(map(len, words))
+        self._invalidate_cache()
+    
+    def _total_word_length(self) -> int:
+        """Sum of all word lengths."""
+        if np is not None:
+            return int(self._word_lens.sum())
+        return sum(self._word_lens)
+    
+    def _invalidate_cache(self):
+        """Drop analysis results computed for the previously loaded text."""
+        for name in ('_stats', '_readability', '_sentiment'):
+            self.__dict__.pop(name, None)
+    
+    @cached_property
+    def _stats(self) -> Dict:
+        """Basic statistics of the loaded text, computed once per load."""
+        return {
+            'character_count': self._char_count,
+            'character_count_no_spaces': self._char_count_no_spaces,
+            'word_count': len(self.words),
+            'sentence_count': len(self.sentences),
+            'paragraph_count': self._paragraph_count,
+            'average_word_length': self._total_word_length() / len(self.words) if self.words else 0,
+            'average_sentence_length': len(self.words) / len(self.sentences) if self.sentences else 0,
+            'unique_words': len(self._word_set),
+            'lexical_diversity': len(self._word_set) / len(self.words) if self.words else 0
+        }
+    
+    @cached_property
+    def _readability(self) -> Dict[str, float]:
+        """Readability metrics of the loaded text, computed once per load."""
+        # Count syllables (approximation)
+        total_syllables = _count_syllables(self.words)
+        total_words = len(self.words)
+        total_sentences = len(self.sentences)
+        
+        # Flesch Reading Ease Score
+        if total_sentences > 0 and total_words > 0:
+            flesch_score = (206.835 - 
+                          (1.015 * (total_words / total_sentences)) - 
+                          (84.6 * (total_syllables / total_words)))
+        else:
+            flesch_score = 0
+        
+        # Flesch-Kincaid Grade Level
+        if total_sentences > 0 and total_words > 0:
+            fk_grade = (0.39 * (total_words / total_sentences) + 
+                      11.8 * (total_syllables / total_words) - 15.59)
+        else:
+            fk_grade = 0
+        
+        # Automated Readability Index
+        characters = self._total_word_length()
+        if total_sentences > 0 and total_words > 0:
+            ari = (4.71 * (characters / total_words) + 
+                  0.5 * (total_words / total_sentences) - 21.43)
+        else:
+            ari = 0
+        
+        return {
+            'flesch_reading_ease': flesch_score,
+            'flesch_kincaid_grade': max(0, fk_grade),
+            'automated_readability_index': max(0, ari),
+            'average_syllables_per_word': total_syllables / total_words if total_words > 0 else 0,
+            'total_syllables': total_syllables
+        }
+    
+    @cached_property
+    def _sentiment(self) -> Dict[str, Union[float, int]]:
+        """Word-list sentiment of the loaded text, computed once per load."""
+        # Look up only the (small) sentiment vocabularies in the cached counts
+        word_counts = self._word_counter
+        
+        positive_count = sum(word_counts[word] for word in _POSITIVE_WORDS)
+        negative_count = sum(word_counts[word] for word in _NEGATIVE_WORDS)
+        neutral_count = len(self.words) - positive_count - negative_count
+        
+        total_sentiment_words = positive_count + negative_count
+        
+        if total_sentiment_words > 0:
+            sentiment_score = (positive_count - negative_count) / total_sentiment_words
+        else:
+            sentiment_score = 0.0
+        
+        # Classify overall sentiment
+        if sentiment_score > 0.1:
+            overall_sentiment = "Positive"
+        elif sentiment_score < -0.1:
+            overall_sentiment = "Negative"
+        else:
+            overall_sentiment = "Neutral"
+        
+        return {
+            'positive_words': positive_count,
+            'negative_words': negative_count,
+            'neutral_words': neutral_count,
+            'sentiment_score': sentiment_score,
+            'overall_sentiment': overall_sentiment,
+            'total_words': len(self.words)
+        }
+    
     def get_basic_statistics(self) -> Dict:
         """
         Get basic text statistics.
@@ -203,22 +623,12 @@ class TextAnalyzer:
         Returns:
             Dict: Dictionary containing basic statistics
         """
-        if not self.original_text:
+        if not self.original_text and not self.words:
             print("No text loaded.")
             return {}
         
         try:
-            stats = {
-                'character_count': len(self.original_text),
-                'character_count_no_spaces': len(self.original_text.replace(' ', '')),
-                'word_count': len(self.words),
-                'sentence_count': len(self.sentences),
-                'paragraph_count': len([p for p in self.original_text.split('\n\n') if p.strip()]),
-                'average_word_length': sum(len(word) for word in self.words) / len(self.words) if self.words else 0,
-                'average_sentence_length': len(self.words) / len(self.sentences) if self.sentences else 0,
-                'unique_words': len(set(self.words)),
-                'lexical_diversity': len(set(self.words)) / len(self.words) if self.words else 0
-            }
+            stats = dict(self._stats)
             
             print("=== BASIC TEXT STATISTICS ===")
             print(f"Characters (with spaces): {stats['character_count']:,}")
@@ -254,21 +664,25 @@ class TextAnalyzer:
             return []
         
         try:
-            # Filter words if needed
+            # Rank the cached counts (one entry per unique word) directly;
+            # stop-word totals come from the small stop-word set
+            word_counts = self._word_counter
             if exclude_stop_words:
-                filtered_words = [word for word in self.words if word not in self.stop_words]
+                stop_words = self.stop_words
+                total_words = len(self.words) - sum(word_counts[word] for word in stop_words
+                                                    if word in word_counts)
+                top_words = heapq.nlargest(top_n, ((word, count) for word, count in word_counts.items()
+                                                   if word not in stop_words),
+                                           key=itemgetter(1))
             else:
-                filtered_words = self.words
-            
-            # Count word frequencies
-            word_freq = Counter(filtered_words)
-            top_words = word_freq.most_common(top_n)
+                total_words = len(self.words)
+                top_words = word_counts.most_common(top_n)
             
             print(f"=== TOP {top_n} WORD FREQUENCIES ===")
             print("(Excluding stop words)" if exclude_stop_words else "(Including all words)")
             
             for i, (word, count) in enumerate(top_words, 1):
-                percentage = (count / len(filtered_words)) * 100
+                percentage = (count / total_words) * 100
                 print(f"{i:2d}. {word:<15} {count:4d} ({percentage:5.2f}%)")
             
             return top_words
@@ -292,15 +706,16 @@ class TextAnalyzer:
             return []
         
         try:
-            # Count only alphabetic characters
-            chars = [c.lower() for c in self.original_text if c.isalpha()]
-            char_freq = Counter(chars)
+            # Count every character in C, then keep only the alphabetic keys
+            all_chars = Counter(self.original_text.lower())
+            char_freq = Counter({c: n for c, n in all_chars.items() if c.isalpha()})
+            total_chars = sum(char_freq.values())
             top_chars = char_freq.most_common(top_n)
             
             print(f"=== TOP {top_n} CHARACTER FREQUENCIES ===")
             
             for i, (char, count) in enumerate(top_chars, 1):
-                percentage = (count / len(chars)) * 100
+                percentage = (count / total_chars) * 100
                 print(f"{i:2d}. {char.upper():<3} {count:5d} ({percentage:5.2f}%)")
             
             return top_chars
@@ -321,19 +736,24 @@ class TextAnalyzer:
             return {}
         
         try:
-            length_dist = Counter(len(word) for word in self.words)
+            # Both paths build the dict in ascending length order
+            if np is not None:
+                # Bin indices are the lengths; tolist() yields plain ints
+                length_dist = {length: count for length, count
+                               in enumerate(np.bincount(self._word_lens).tolist()) if count}
+            else:
+                length_dist = dict(sorted(Counter(self._word_lens).items()))
             
             print("=== WORD LENGTH DISTRIBUTION ===")
             print("Length | Count | Percentage")
             print("-" * 30)
             
             total_words = len(self.words)
-            for length in sorted(length_dist.keys()):
-                count = length_dist[length]
+            for length, count in length_dist.items():
                 percentage = (count / total_words) * 100
                 print(f"{length:6d} | {count:5d} | {percentage:9.2f}%")
             
-            return dict(length_dist)
+            return length_dist
             
         except Exception as e:
             print(f"Error analyzing word length distribution: {e}")
@@ -356,16 +776,9 @@ class TextAnalyzer:
         
         try:
             flags = 0 if case_sensitive else re.IGNORECASE
-            matches = re.findall(pattern, self.original_text, flags)
+            matches = _compile(pattern, flags).findall(self.original_text)
             
-            print(f"=== PATTERN SEARCH: '{pattern}' ===")
-            print(f"Found {len(matches)} matches")
-            
-            if matches:
-                # Show unique matches with counts
-                match_counts = Counter(matches)
-                for match, count in match_counts.most_common():
-                    print(f"  '{match}': {count} times")
+            self._print_matches(pattern, matches)
             
             return matches
             
@@ -373,6 +786,64 @@ class TextAnalyzer:
             print(f"Error finding patterns: {e}")
             return []
     
+    def find_pattern_groups(self, patterns: Dict[str, str],
+                            case_sensitive: bool = False) -> Dict[str, List[str]]:
+        """
+        Search for several patterns in a single pass over the text.
+        
+        The patterns are fused into one alternation of named groups, so the
+        text is scanned once instead of once per pattern. Each span of text
+        is attributed to the first pattern (in dict order) that matches it;
+        use find_patterns separately when overlapping matches must be
+        counted for more than one pattern. Scoped flags such as (?i:...)
+        can be used to vary case sensitivity per pattern.
+        
+        Args:
+            patterns: Mapping of group name to regex pattern (names must be
+                      valid identifiers; patterns must not define named groups)
+            case_sensitive: Whether search should be case sensitive
+            
+        Returns:
+            Dict[str, List[str]]: Matches for each pattern name
+        """
+        if not self.original_text:
+            print("No text available for pattern search.")
+            return {}
+        
+        try:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            fused = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in patterns.items())
+            
+            results = {name: [] for name in patterns}
+            for match in _compile(fused, flags).finditer(self.original_text):
+                results[match.lastgroup].append(match.group())
+            
+            for name, pattern in patterns.items():
+                self._print_matches(pattern, results[name])
+            
+            return results
+            
+        except Exception as e:
+            print(f"Error finding patterns: {e}")
+            return {}
+    
+    def _print_matches(self, pattern: str, matches: List[str]):
+        """
+        Print a pattern's match count and its unique matches with counts.
+        
+        Args:
+            pattern: Pattern that was searched for
+            matches: Matches found for it
+        """
+        print(f"=== PATTERN SEARCH: '{pattern}' ===")
+        print(f"Found {len(matches)} matches")
+        
+        if matches:
+            # Show unique matches with counts
+            match_counts = Counter(matches)
+            for match, count in match_counts.most_common():
+                print(f"  '{match}': {count} times")
+    
     def get_readability_metrics(self) -> Dict[str, float]:
         """
         Calculate basic readability metrics.
@@ -385,61 +856,8 @@ class TextAnalyzer:
             return {}
         
         try:
-            # Count syllables (approximation)
-            def count_syllables(word):
-                word = word.lower()
-                vowels = 'aeiouy'
-                syllable_count = 0
-                prev_was_vowel = False
-                
-                for char in word:
-                    if char in vowels:
-                        if not prev_was_vowel:
-                            syllable_count += 1
-                        prev_was_vowel = True
-                    else:
-                        prev_was_vowel = False
-                
-                # Handle silent 'e' at the end
-                if word.endswith('e') and syllable_count > 1:
-                    syllable_count -= 1
-                
-                return max(1, syllable_count)
-            
-            total_syllables = sum(count_syllables(word) for word in self.words)
-            total_words = len(self.words)
-            total_sentences = len(self.sentences)
-            
-            # Flesch Reading Ease Score
-            if total_sentences > 0 and total_words > 0:
-                flesch_score = (206.835 - 
-                              (1.015 * (total_words / total_sentences)) - 
-                              (84.6 * (total_syllables / total_words)))
-            else:
-                flesch_score = 0
-            
-            # Flesch-Kincaid Grade Level
-            if total_sentences > 0 and total_words > 0:
-                fk_grade = (0.39 * (total_words / total_sentences) + 
-                          11.8 * (total_syllables / total_words) - 15.59)
-            else:
-                fk_grade = 0
-            
-            # Automated Readability Index
-            characters = sum(len(word) for word in self.words)
-            if total_sentences > 0 and total_words > 0:
-                ari = (4.71 * (characters / total_words) + 
-                      0.5 * (total_words / total_sentences) - 21.43)
-            else:
-                ari = 0
-            
-            metrics = {
-                'flesch_reading_ease': flesch_score,
-                'flesch_kincaid_grade': max(0, fk_grade),
-                'automated_readability_index': max(0, ari),
-                'average_syllables_per_word': total_syllables / total_words if total_words > 0 else 0,
-                'total_syllables': total_syllables
-            }
+            metrics = dict(self._readability)
+            flesch_score = metrics['flesch_reading_ease']
             
             print("=== READABILITY METRICS ===")
             print(f"Flesch Reading Ease: {metrics['flesch_reading_ease']:.2f}")
@@ -483,57 +901,14 @@ class TextAnalyzer:
             return {}
         
         try:
-            # Simple positive and negative word lists
-            positive_words = {
-                'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
-                'awesome', 'brilliant', 'outstanding', 'perfect', 'beautiful',
-                'happy', 'joy', 'love', 'like', 'best', 'better', 'success',
-                'successful', 'win', 'winning', 'positive', 'optimistic',
-                'pleased', 'delighted', 'thrilled', 'excited', 'cheerful'
-            }
-            
-            negative_words = {
-                'bad', 'terrible', 'awful', 'horrible', 'disgusting', 'hate',
-                'dislike', 'worst', 'worse', 'fail', 'failure', 'negative',
-                'pessimistic', 'sad', 'angry', 'mad', 'disappointed', 'upset',
-                'frustrated', 'annoying', 'irritating', 'boring', 'stupid',
-                'ridiculous', 'pathetic', 'useless', 'worthless', 'disaster'
-            }
-            
-            positive_count = sum(1 for word in self.words if word in positive_words)
-            negative_count = sum(1 for word in self.words if word in negative_words)
-            neutral_count = len(self.words) - positive_count - negative_count
-            
-            total_sentiment_words = positive_count + negative_count
-            
-            if total_sentiment_words > 0:
-                sentiment_score = (positive_count - negative_count) / total_sentiment_words
-            else:
-                sentiment_score = 0.0
-            
-            # Classify overall sentiment
-            if sentiment_score > 0.1:
-                overall_sentiment = "Positive"
-            elif sentiment_score < -0.1:
-                overall_sentiment = "Negative"
-            else:
-                overall_sentiment = "Neutral"
-            
-            results = {
-                'positive_words': positive_count,
-                'negative_words': negative_count,
-                'neutral_words': neutral_count,
-                'sentiment_score': sentiment_score,
-                'overall_sentiment': overall_sentiment,
-                'total_words': len(self.words)
-            }
+            results = dict(self._sentiment)
             
             print("=== SENTIMENT ANALYSIS ===")
-            print(f"Positive words: {positive_count}")
-            print(f"Negative words: {negative_count}")
-            print(f"Neutral words: {neutral_count}")
-            print(f"Sentiment score: {sentiment_score:.3f}")
-            print(f"Overall sentiment: {overall_sentiment}")
+            print(f"Positive words: {results['positive_words']}")
+            print(f"Negative words: {results['negative_words']}")
+            print(f"Neutral words: {results['neutral_words']}")
+            print(f"Sentiment score: {results['sentiment_score']:.3f}")
+            print(f"Overall sentiment: {results['overall_sentiment']}")
             
             return results
             
@@ -551,48 +926,52 @@ class TextAnalyzer:
         Returns:
             bool: True if export successful
         """
-        if not self.original_text:
+        if not self.original_text and not self.words:
             print("No text to analyze.")
             return False
         
         try:
+            # Build the whole report in memory and write it out once
+            report = io.StringIO()
+            report.write("TEXT ANALYSIS REPORT\n")
+            report.write("=" * 50 + "\n\n")
+            
+            # Basic statistics
+            stats = self.get_basic_statistics()
+            report.write("BASIC STATISTICS:\n")
+            report.write("-" * 20 + "\n")
+            for key, value in stats.items():
+                report.write(f"{key}: {value}\n")
+            
+            report.write("\n")
+            
+            # Top words
+            report.write("TOP 20 WORDS (excluding stop words):\n")
+            report.write("-" * 40 + "\n")
+            word_freq = self.get_word_frequency(20, exclude_stop_words=True)
+            for i, (word, count) in enumerate(word_freq, 1):
+                report.write(f"{i:2d}. {word:<15} {count:4d}\n")
+            
+            report.write("\n")
+            
+            # Readability metrics
+            readability = self.get_readability_metrics()
+            report.write("READABILITY METRICS:\n")
+            report.write("-" * 20 + "\n")
+            for key, value in readability.items():
+                report.write(f"{key}: {value}\n")
+            
+            report.write("\n")
+            
+            # Sentiment analysis
+            sentiment = self.analyze_sentiment()
+            report.write("SENTIMENT ANALYSIS:\n")
+            report.write("-" * 20 + "\n")
+            for key, value in sentiment.items():
+                report.write(f"{key}: {value}\n")
+            
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write("TEXT ANALYSIS REPORT\n")
-                f.write("=" * 50 + "\n\n")
-                
-                # Basic statistics
-                stats = self.get_basic_statistics()
-                f.write("BASIC STATISTICS:\n")
-                f.write("-" * 20 + "\n")
-                for key, value in stats.items():
-                    f.write(f"{key}: {value}\n")
-                
-                f.write("\n")
-                
-                # Top words
-                f.write("TOP 20 WORDS (excluding stop words):\n")
-                f.write("-" * 40 + "\n")
-                word_freq = self.get_word_frequency(20, exclude_stop_words=True)
-                for i, (word, count) in enumerate(word_freq, 1):
-                    f.write(f"{i:2d}. {word:<15} {count:4d}\n")
-                
-                f.write("\n")
-                
-                # Readability metrics
-                readability = self.get_readability_metrics()
-                f.write("READABILITY METRICS:\n")
-                f.write("-" * 20 + "\n")
-                for key, value in readability.items():
-                    f.write(f"{key}: {value}\n")
-                
-                f.write("\n")
-                
-                # Sentiment analysis
-                sentiment = self.analyze_sentiment()
-                f.write("SENTIMENT ANALYSIS:\n")
-                f.write("-" * 20 + "\n")
-                for key, value in sentiment.items():
-                    f.write(f"{key}: {value}\n")
+                f.write(report.getvalue())
             
             print(f"Analysis exported to: {filename}")
             return True
@@ -705,14 +1084,12 @@ def main():
         print("\n")
         print("=== PATTERN SEARCH EXAMPLES ===")
         
-        # Find email patterns
-        analyzer.find_patterns(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        
-        # Find words ending in 'ing'
-        analyzer.find_patterns(r'\b\w+ing\b', case_sensitive=False)
-        
-        # Find words starting with capital letters
-        analyzer.find_patterns(r'\b[A-Z][a-z]+\b')
+        # Find emails, words ending in 'ing' and capitalized words in one scan
+        analyzer.find_pattern_groups({
+            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
+            'ing': r'(?i:\b\w+ing\b)',
+            'capitalized': r'\b[A-Z][a-z]+\b',
+        }, case_sensitive=True)
         
         # 8. Export Results
         output_file = "text_analysis_report.txt"